@@ -25,6 +25,7 @@ class IdeatorAgent:
         self.model = self.config.ideator_model
         self.temperature = self.config.ideator_temperature
         self.max_tokens = self.config.get_setting("models", "ideator_max_tokens", default=4000)
+        self.stream = self.config.get_setting("models", "ideator_stream", default=True)
         
         # Load prompts
         self.system_prompt = self.config.get_prompt("ideator", "system_prompt")
@@ -73,6 +74,7 @@ class IdeatorAgent:
                 response_model=ProductConcept,
                 temperature=self.temperature,
                 max_tokens=self.max_tokens,
+                stream=self.stream,
             )
             
             self.logger.log_agent_complete("Ideator")
@@ -123,6 +125,7 @@ class IdeatorAgent:
                 response_model=ProductConcept,
                 temperature=self.temperature,
                 max_tokens=self.max_tokens,
+                stream=self.stream,
             )
             
             self.logger.log_agent_complete("Ideator")
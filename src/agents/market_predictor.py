@@ -1,8 +1,11 @@
 """Market Predictor Agent - Simulate market response and calculate PMF using SSR."""
 
-from typing import List
+from typing import List, Optional
 import statistics
 from collections import Counter
+from itertools import chain
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import numpy as np
 import polars as po
 from semantic_similarity_rating import ResponseRater
@@ -14,11 +17,24 @@ from ..utils import (
     ProductConcept,
     Persona,
     PersonaResponse,
+    PersonaResponseBatch,
     MarketFitScore,
     MarketSegmentation,
+    InsufficientDataError,
 )
 
 
+# Likert levels used to turn a PMF into an expected rating
+_LIKERT_LEVELS = np.arange(1, 6, dtype=float)
+
+
+@lru_cache(maxsize=2)
+def _load_embedder(model_name: str):
+    """Load a sentence embedding model once per process."""
+    from sentence_transformers import SentenceTransformer
+    return SentenceTransformer(model_name)
+
+
 class MarketPredictorAgent:
     """
     Simulates market response by having personas evaluate product concepts.
@@ -41,6 +57,16 @@ class MarketPredictorAgent:
         # Load prompts
         self.system_prompt = self.config.get_prompt("market_predictor", "system_prompt")
         self.response_prompt_template = self.config.get_prompt("market_predictor", "simulate_response_prompt")
+        self.batch_prompt_template = self.config.get_prompt("market_predictor", "simulate_batch_prompt")
+        
+        # Personas answered per API call (1 = one request per persona)
+        self.personas_per_call = max(
+            1, self.config.get_setting("market_simulation", "personas_per_call", default=1)
+        )
+        
+        # Lazily loaded embedder + persona embedding cache for relevance filtering
+        self._embedder = None
+        self._persona_embeddings: dict = {}
         
         # Initialize SSR raters with reference sentences for each dimension
         self._initialize_ssr_raters()
@@ -175,6 +201,70 @@ class MarketPredictorAgent:
         self.logger.log_info(f"Using model: {embedding_model}")
         self.logger.log_info(f"Temperature: {self.config.ssr_temperature}, Epsilon: {self.config.ssr_epsilon}")
     
+    def select_relevant_personas(
+        self,
+        concept: ProductConcept,
+        personas: List[Persona],
+        fraction: float = 0.5
+    ) -> List[Persona]:
+        """
+        Keep the personas most semantically related to the concept.
+        
+        Embeds the concept and each persona with the SSR embedding model and
+        keeps the top ``fraction`` by cosine similarity, in their original order.
+        Persona embeddings are cached, so later iterations only embed the concept.
+        
+        Args:
+            concept: Product concept being evaluated
+            personas: Candidate personas
+            fraction: Share of personas to keep (0-1]
+        
+        Returns:
+            Filtered list of personas
+        """
+        keep = max(1, int(round(len(personas) * fraction)))
+        if keep >= len(personas):
+            return list(personas)
+        
+        embedder = self._get_embedder()
+        
+        missing = [p for p in personas if p.identity_key() not in self._persona_embeddings]
+        if missing:
+            vectors = embedder.encode(
+                [self._persona_text(p) for p in missing], normalize_embeddings=True
+            )
+            for persona, vector in zip(missing, vectors):
+                self._persona_embeddings[persona.identity_key()] = vector
+        
+        concept_text = f"{concept.name}. {concept.tagline} For {concept.target_market}. {concept.problem_solved}"
+        concept_vec = embedder.encode(concept_text, normalize_embeddings=True)
+        
+        # Normalized embeddings: cosine similarity is a single matrix-vector product
+        matrix = np.stack([self._persona_embeddings[p.identity_key()] for p in personas])
+        sims = matrix @ concept_vec
+        top = np.sort(np.argpartition(-sims, keep - 1)[:keep])
+        
+        self.logger.log_info(f"Relevance filter kept {keep}/{len(personas)} personas")
+        return [personas[i] for i in top]
+    
+    def _get_embedder(self):
+        """Get the sentence embedding model, reusing the one the SSR raters loaded."""
+        if self._embedder is None:
+            shared = getattr(getattr(self, "interest_rater", None), "model", None)
+            if hasattr(shared, "encode"):
+                self._embedder = shared
+            else:
+                self._embedder = _load_embedder(self.config.ssr_embedding_model)
+        return self._embedder
+    
+    @staticmethod
+    def _persona_text(persona: Persona) -> str:
+        return (
+            f"{persona.age}-year-old {persona.occupation}, {persona.income_bracket} income, "
+            f"{persona.location_type}. Values: {', '.join(persona.values)}. "
+            f"Pain points: {', '.join(persona.pain_points)}."
+        )
+    
     def simulate_market_response(
         self,
         concept: ProductConcept,
@@ -201,17 +291,35 @@ class MarketPredictorAgent:
             progress.start()
             task = progress.add_task("Responses", total=len(personas))
         
-        for persona in personas:
+        def simulate(persona: Persona) -> Optional[PersonaResponse]:
             try:
-                response = self._simulate_single_response(persona, concept)
-                responses.append(response)
-                
-                if progress:
-                    progress.update(task, advance=1)
-            
+                return self._simulate_single_response(persona, concept)
             except Exception as e:
                 self.logger.log_warning(f"Failed to simulate response for {persona.name}: {e}")
-                continue
+                return None
+        
+        def simulate_group(group: List[Persona]) -> List[Optional[PersonaResponse]]:
+            if len(group) > 1:
+                try:
+                    return self._simulate_batch_responses(group, concept)
+                except Exception as e:
+                    self.logger.log_warning(
+                        f"Batched simulation failed for {len(group)} personas, retrying individually: {e}"
+                    )
+            return [simulate(persona) for persona in group]
+        
+        # Personas are coalesced into groups answered by one call each; groups
+        # are independent, I/O-bound calls, so fan them out and consume with
+        # map() so responses keep the persona order
+        k = self.personas_per_call
+        groups = [personas[i:i + k] for i in range(0, len(personas), k)]
+        max_workers = max(1, min(len(groups), self.config.api_max_concurrency))
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            for group, group_responses in zip(groups, pool.map(simulate_group, groups)):
+                responses.extend(r for r in group_responses if r is not None)
+                
+                if progress:
+                    progress.update(task, advance=len(group))
         
         if progress:
             progress.stop()
@@ -273,6 +381,69 @@ class MarketPredictorAgent:
         
         return response
     
+    def _simulate_batch_responses(
+        self,
+        personas: List[Persona],
+        concept: ProductConcept
+    ) -> List[PersonaResponse]:
+        """
+        Simulate responses from several personas with a single API call.
+        
+        Args:
+            personas: Personas to simulate (answered in this order)
+            concept: Product concept
+        
+        Returns:
+            One PersonaResponse per persona
+        
+        Raises:
+            ValueError: If the model did not answer for every persona
+        """
+        participants = "\n\n".join(
+            f"Participant {i}:\n"
+            f"- Name: {ctx['persona_name']}\n"
+            f"- Age: {ctx['persona_age']}\n"
+            f"- Occupation: {ctx['persona_occupation']}\n"
+            f"- Values: {ctx['persona_values']}\n"
+            f"- Current challenges: {ctx['persona_pain_points']}\n"
+            f"- Comfort with technology: {ctx['persona_tech_level']}/5\n"
+            f"- Income level: {ctx['persona_income']}"
+            for i, ctx in enumerate((p.to_prompt_context() for p in personas), start=1)
+        )
+        
+        user_prompt = self.batch_prompt_template.format(
+            participant_count=len(personas),
+            participants=participants,
+            product_name=concept.name,
+            product_tagline=concept.tagline,
+            problem_solved=concept.problem_solved,
+            target_market=concept.target_market,
+            features="\n".join(f"- {f}" for f in concept.features),
+            pricing_model=concept.pricing_model,
+        )
+        
+        messages = [
+            {"role": "system", "content": self.system_prompt},
+            {"role": "user", "content": user_prompt}
+        ]
+        
+        batch = self.client.chat_completion_with_structured_output(
+            model=self.model,
+            messages=messages,
+            response_model=PersonaResponseBatch,
+            temperature=self.temperature,
+            max_tokens=1000 * len(personas),
+        )
+        
+        if len(batch.responses) != len(personas):
+            raise ValueError(f"expected {len(personas)} responses, got {len(batch.responses)}")
+        
+        # Responses are positional; names from the model are not trusted
+        for persona, response in zip(personas, batch.responses):
+            response.persona_name = persona.name
+        
+        return batch.responses
+    
     def calculate_pmf(
         self,
         responses: List[PersonaResponse],
@@ -295,8 +466,6 @@ class MarketPredictorAgent:
         Returns:
             MarketFitScore object with enhanced metrics
         """
-        from ..utils.exceptions import InsufficientDataError
-        
         if not responses:
             raise InsufficientDataError(required=10, actual=0)
         
@@ -338,10 +507,16 @@ class MarketPredictorAgent:
         
         # Aggregate PMFs to get survey-level probability distributions
         # This is the key SSR insight: maintain uncertainty through probability distributions
-        survey_interest_pmf = interest_pmfs.mean(axis=0)  # Average across all personas
-        survey_purchase_intent_pmf = purchase_intent_pmfs.mean(axis=0)
-        survey_disappointment_pmf = disappointment_pmfs.mean(axis=0)
-        survey_recommendation_pmf = recommendation_pmfs.mean(axis=0)
+        # (4 dimensions, personas, 5 levels) -> average across all personas in one pass
+        survey_pmfs = np.stack([
+            interest_pmfs, purchase_intent_pmfs, disappointment_pmfs, recommendation_pmfs
+        ]).mean(axis=1)
+        (
+            survey_interest_pmf,
+            survey_purchase_intent_pmf,
+            survey_disappointment_pmf,
+            survey_recommendation_pmf,
+        ) = survey_pmfs
         
         # Log PMFs for debugging
         self.logger.log_info(f"Survey Interest PMF: {survey_interest_pmf}")
@@ -349,9 +524,8 @@ class MarketPredictorAgent:
         self.logger.log_info(f"Survey Disappointment PMF: {survey_disappointment_pmf}")
         
         # Calculate expected values from aggregated PMFs
-        avg_interest = float(np.dot(survey_interest_pmf, [1, 2, 3, 4, 5]))
-        avg_disappointment = float(np.dot(survey_disappointment_pmf, [1, 2, 3, 4, 5]))
-        avg_recommendation = float(np.dot(survey_recommendation_pmf, [1, 2, 3, 4, 5]))
+        expected_ratings = survey_pmfs @ _LIKERT_LEVELS
+        avg_interest = float(expected_ratings[0])
         
         # Traditional PMF Score: P(very disappointed) = P(level 4) + P(level 5)
         # This is the Sean Ellis PMF: probability of being "very disappointed"
@@ -418,13 +592,11 @@ class MarketPredictorAgent:
         }
         
         # 8. Top Benefits
-        all_benefits = [r.main_benefit for r in responses]
-        benefit_counter = Counter(all_benefits)
+        benefit_counter = Counter(r.main_benefit for r in responses)
         top_benefits = [benefit for benefit, _ in benefit_counter.most_common(5)]
         
         # 9. Top Concerns
-        all_concerns = [concern for r in responses for concern in r.concerns]
-        concern_counter = Counter(all_concerns)
+        concern_counter = Counter(chain.from_iterable(r.concerns for r in responses))
         top_concerns = [concern for concern, _ in concern_counter.most_common(5)]
         
         # 10. Business Model Recommendation (based on market segmentation)
@@ -1,16 +1,22 @@
 """Persona Generator - Create diverse synthetic consumer personas."""
 
-from typing import List, Dict, Tuple
-import json
+from typing import Callable, Iterator, List, Dict, Set, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import orjson
 from collections import Counter
 from ..utils import (
     get_config,
     get_openrouter_client,
     get_logger,
     Persona,
+    PersonaGenerationError,
 )
 
 
+# Measured average completion size of one persona object (JSON, all fields)
+TOKENS_PER_PERSONA = 220
+
+
 class PersonaGenerator:
     """
     Generates diverse synthetic consumer personas for market simulation.
@@ -26,6 +32,8 @@ class PersonaGenerator:
         # Model configuration
         self.model = self.config.persona_generator_model
         self.temperature = self.config.get_setting("models", "persona_temperature", default=0.8)
+        self.max_tokens_cap = self.config.get_setting("models", "persona_max_tokens", default=8000)
+        self.max_concurrency = max(1, self.config.api_max_concurrency)
         
         # Load prompts
         self.system_prompt = self.config.get_prompt("persona_generator", "system_prompt")
@@ -34,6 +42,9 @@ class PersonaGenerator:
         # Cache personas for reuse
         self._persona_cache: List[Persona] = []
         
+        # (name, age, occupation) keys seen during the current generation run
+        self._seen_keys: Set[Tuple[str, int, str]] = set()
+        
         # Load target distributions for stratified sampling
         self.target_distributions = self._load_target_distributions()
         self.use_stratified = self.config.get_setting("persona_generation", "strategy", default="stratified") == "stratified"
@@ -51,6 +62,39 @@ class PersonaGenerator:
             self.logger.log_warning(f"Could not load target distributions: {e}")
             return {}
     
+    def _max_tokens_for(self, count: int) -> int:
+        """Size the completion budget to the number of personas requested."""
+        return min(self.max_tokens_cap, int(TOKENS_PER_PERSONA * count * 1.3) + 500)
+    
+    def _plan_batches(self, remaining: int, batch_size: int) -> List[int]:
+        """Split the remaining personas into one round of concurrent batch sizes."""
+        sizes = [min(batch_size, remaining - start) for start in range(0, remaining, batch_size)]
+        return sizes[:self.max_concurrency]
+    
+    def _run_batches(
+        self,
+        batch_fn: Callable[[int], List[Persona]],
+        sizes: List[int]
+    ) -> Iterator[List[Persona]]:
+        """
+        Run persona batches concurrently, yielding each one as soon as it is parsed.
+        
+        Args:
+            batch_fn: Callable generating (and parsing) a batch of the given size
+            sizes: Batch sizes to request in this round
+        
+        Yields:
+            Parsed batches in completion order
+        """
+        if len(sizes) == 1:
+            yield batch_fn(sizes[0])
+            return
+        
+        with ThreadPoolExecutor(max_workers=len(sizes)) as pool:
+            futures = [pool.submit(batch_fn, size) for size in sizes]
+            for future in as_completed(futures):
+                yield future.result()
+    
     def generate_personas(self, count: int = 100) -> List[Persona]:
         """
         Generate diverse consumer personas.
@@ -68,6 +112,8 @@ class PersonaGenerator:
             self.logger.log_info(f"Using {count} cached personas")
             return self._persona_cache[:count]
         
+        self._seen_keys.clear()
+        
         # Use stratified generation if enabled
         if self.use_stratified and self.target_distributions:
             return self.generate_personas_stratified(count)
@@ -88,36 +134,35 @@ class PersonaGenerator:
             task = progress.add_task("Personas", total=count)
         
         while len(personas) < count:
-            remaining = count - len(personas)
-            current_batch_size = min(batch_size, remaining)
-            
-            # Generate batch
-            batch = self._generate_batch(current_batch_size)
+            sizes = self._plan_batches(count - len(personas), batch_size)
             
-            # Check if batch is empty (failed to parse any personas)
-            if not batch:
-                failed_batches += 1
-                self.logger.log_warning(f"Batch failed ({failed_batches}/{max_failed_batches})")
+            # Generate a round of batches concurrently, parsing each as it arrives
+            for batch in self._run_batches(self._generate_batch, sizes):
+                batch = self._keep_unique(batch)
                 
-                if failed_batches >= max_failed_batches:
-                    from ..utils.exceptions import PersonaGenerationError
-                    self.logger.log_error(f"Failed to generate personas after {max_failed_batches} attempts. Check prompt formatting.")
-                    raise PersonaGenerationError(
-                        f"Failed to generate personas after {max_failed_batches} attempts. "
-                        f"Successfully generated {len(personas)} personas before failures. "
-                        f"This may be due to:\n"
-                        f"  1. Model not supporting structured JSON output reliably\n"
-                        f"  2. Rate limiting or API timeouts\n"
-                        f"  3. Prompt complexity issues\n"
-                        f"Try: Using a different model (e.g., 'google/gemini-2.5-flash') or reducing batch size."
-                    )
-            else:
-                failed_batches = 0  # Reset counter on success
-            
-            personas.extend(batch)
-            
-            if progress:
-                progress.update(task, completed=len(personas))
+                # Check if batch is empty (failed to parse any personas)
+                if not batch:
+                    failed_batches += 1
+                    self.logger.log_warning(f"Batch failed ({failed_batches}/{max_failed_batches})")
+                    
+                    if failed_batches >= max_failed_batches:
+                        self.logger.log_error(f"Failed to generate personas after {max_failed_batches} attempts. Check prompt formatting.")
+                        raise PersonaGenerationError(
+                            f"Failed to generate personas after {max_failed_batches} attempts. "
+                            f"Successfully generated {len(personas)} personas before failures. "
+                            f"This may be due to:\n"
+                            f"  1. Model not supporting structured JSON output reliably\n"
+                            f"  2. Rate limiting or API timeouts\n"
+                            f"  3. Prompt complexity issues\n"
+                            f"Try: Using a different model (e.g., 'google/gemini-2.5-flash') or reducing batch size."
+                        )
+                else:
+                    failed_batches = 0  # Reset counter on success
+                
+                personas.extend(batch)
+                
+                if progress:
+                    progress.update(task, completed=len(personas))
         
         if progress:
             progress.stop()
@@ -144,6 +189,8 @@ class PersonaGenerator:
         self.logger.log_agent_start("Persona Generator", 
             f"Generating {count} stratified personas")
         
+        self._seen_keys.clear()
+        
         # Calculate quotas for each demographic segment
         quotas = self._calculate_quotas(count)
         self.logger.log_info(f"Target quotas calculated for {count} personas")
@@ -159,28 +206,33 @@ class PersonaGenerator:
             progress.start()
             task = progress.add_task("Personas", total=count)
         
+        def quota_batch(size: int) -> List[Persona]:
+            return self._generate_batch_with_quotas(size, quotas)
+        
         while len(personas) < count:
-            remaining = count - len(personas)
-            current_batch_size = min(batch_size, remaining)
-            
-            # Generate batch with quota requirements
-            batch = self._generate_batch_with_quotas(current_batch_size, quotas)
+            sizes = self._plan_batches(count - len(personas), batch_size)
             
-            if not batch:
-                failed_batches += 1
-                self.logger.log_warning(f"Stratified batch failed ({failed_batches}/{max_failed_batches})")
+            # Generate batches with quota requirements concurrently
+            for batch in self._run_batches(quota_batch, sizes):
+                batch = self._keep_unique(batch)
                 
-                if failed_batches >= max_failed_batches:
-                    self.logger.log_error("Falling back to random generation")
-                    # Fall back to original method
-                    return self._generate_fallback_personas(count - len(personas), personas)
-            else:
-                failed_batches = 0
-            
-            personas.extend(batch)
-            
-            if progress:
-                progress.update(task, completed=len(personas))
+                if not batch:
+                    failed_batches += 1
+                    self.logger.log_warning(f"Stratified batch failed ({failed_batches}/{max_failed_batches})")
+                    
+                    if failed_batches >= max_failed_batches:
+                        if progress:
+                            progress.stop()
+                        self.logger.log_error("Falling back to random generation")
+                        # Fall back to original method
+                        return self._generate_fallback_personas(count - len(personas), personas)
+                else:
+                    failed_batches = 0
+                
+                personas.extend(batch)
+                
+                if progress:
+                    progress.update(task, completed=len(personas))
         
         if progress:
             progress.stop()
@@ -255,50 +307,7 @@ Return JSON with this structure (no additional text, just valid JSON):
 Each persona must have ALL these fields: name (string), age (number 18-85), occupation (string), income_bracket (string matching quotas), location_type (string matching quotas), tech_savviness (number 1-5 matching quotas), values (array of 2 strings), pain_points (array of 2 strings), personality_traits (string), shopping_behavior (string).
 """
         
-        messages = [
-            {"role": "system", "content": self.system_prompt},
-            {"role": "user", "content": user_prompt}
-        ]
-        
-        try:
-            response = self.client.chat_completion(
-                model=self.model,
-                messages=messages,
-                temperature=self.temperature,
-                max_tokens=4000,
-                response_format={"type": "json_object"},
-            )
-            
-            content = response.choices[0].message.content
-            
-            # Parse and validate
-            try:
-                data = json.loads(content)
-            except json.JSONDecodeError:
-                content_fixed = content.replace(",]", "]").replace(",}", "}")
-                try:
-                    data = json.loads(content_fixed)
-                except json.JSONDecodeError:
-                    return []
-            
-            # Extract personas
-            personas_data = self._extract_personas_from_response(data)
-            
-            # Convert to Persona objects
-            personas = []
-            for p_data in personas_data:
-                try:
-                    persona = Persona(**p_data)
-                    personas.append(persona)
-                except Exception as e:
-                    self.logger.log_warning(f"Failed to parse persona: {e}")
-                    continue
-            
-            return personas
-        
-        except Exception as e:
-            self.logger.log_error("Stratified batch generation failed", str(e))
-            return []
+        return self._do_batch_call(user_prompt, batch_size, "Stratified batch generation")
     
     def _format_quotas_for_prompt(self, quotas: Dict, batch_size: int) -> str:
         """Format quota requirements for prompt."""
@@ -423,17 +432,41 @@ Each persona must have ALL these fields: name (string), age (number 18-85), occu
         """Extract persona list from API response (handles different formats)."""
         if isinstance(data, list):
             return data
-        elif isinstance(data, dict):
-            # Look for personas in various possible keys
-            for key in data.keys():
-                clean_key = key.strip().strip('"').strip("'").lower()
-                if 'persona' in clean_key:
-                    return data[key]
-            
-            # If not found, get first list value
-            return next((v for v in data.values() if isinstance(v, list)), [])
+        if not isinstance(data, dict):
+            return []
+
+        # Fast path: nearly every response uses the exact key
+        personas = data.get("personas")
+        if isinstance(personas, list):
+            return personas
+
+        # Look for personas in variant keys (e.g. '"Personas"', 'persona_list')
+        for key, value in data.items():
+            if isinstance(value, list) and 'persona' in key.strip().strip('"\'').lower():
+                return value
+
+        # If not found, get first list value
+        return next((v for v in data.values() if isinstance(v, list)), [])
+    
+    def _keep_unique(self, batch: List[Persona]) -> List[Persona]:
+        """
+        Drop personas already generated in this run.
         
-        return []
+        Duplicates are matched on (name, age, occupation); the generation loops
+        keep requesting batches until the dropped slots are refilled.
+        """
+        unique = []
+        for persona in batch:
+            key = persona.identity_key()
+            if key in self._seen_keys:
+                continue
+            self._seen_keys.add(key)
+            unique.append(persona)
+        
+        dropped = len(batch) - len(unique)
+        if dropped:
+            self.logger.log_info(f"Dropped {dropped} duplicate persona(s)")
+        return unique
     
     def _generate_fallback_personas(self, count: int, existing: List[Persona]) -> List[Persona]:
         """Fallback to random generation if stratified fails."""
@@ -445,7 +478,7 @@ Each persona must have ALL these fields: name (string), age (number 18-85), occu
         
         while len(fallback) < count:
             batch = self._generate_batch(min(batch_size, count - len(fallback)))
-            fallback.extend(batch)
+            fallback.extend(self._keep_unique(batch))
         
         return existing + fallback[:count]
     
@@ -459,98 +492,74 @@ Each persona must have ALL these fields: name (string), age (number 18-85), occu
         Returns:
             List of Persona objects
         """
-        # Format prompt
         user_prompt = self.batch_prompt_template.format(count=count)
+        user_prompt += "\n\nReturn a JSON array of persona objects."
+        return self._do_batch_call(user_prompt, count, "Persona batch generation")
+    
+    def _do_batch_call(self, user_prompt: str, count: int, operation: str) -> List[Persona]:
+        """
+        Request a batch of personas and parse the response.
+        
+        Shared by the random, stratified and targeted generation paths.
+        
+        Args:
+            user_prompt: Fully formatted user prompt
+            count: Number of personas requested (sizes the token budget)
+            operation: Description used in error logs
         
-        # Prepare messages
+        Returns:
+            List of Persona objects (empty if the call or parsing failed)
+        """
         messages = [
             {"role": "system", "content": self.system_prompt},
-            {"role": "user", "content": user_prompt + "\n\nReturn a JSON array of persona objects."}
+            {"role": "user", "content": user_prompt}
         ]
         
         try:
-            # Call API
             response = self.client.chat_completion(
                 model=self.model,
                 messages=messages,
                 temperature=self.temperature,
-                max_tokens=4000,
+                max_tokens=self._max_tokens_for(count),
                 response_format={"type": "json_object"},
             )
-            
-            # Parse response
             content = response.choices[0].message.content
-            
-            # Debug: log first 500 chars of response
-            self.logger.log_info(f"API response preview: {content[:500]}")
-            
-            # Try to parse JSON with repair logic if needed
+        except Exception as e:
+            self.logger.log_error(f"{operation} failed", str(e))
+            return []
+        
+        if not isinstance(content, str):
+            self.logger.log_error(f"{operation} failed", "Empty response content")
+            return []
+        
+        try:
+            # Parse JSON, repairing trailing commas if the strict parse fails
             try:
-                data = json.loads(content)
-            except json.JSONDecodeError as e:
-                # Try to fix common JSON issues
+                data = orjson.loads(content)
+            except orjson.JSONDecodeError as e:
                 self.logger.log_warning(f"JSON parsing failed, attempting repair: {e}")
-                
-                # Remove any trailing commas before closing brackets
                 content_fixed = content.replace(",]", "]").replace(",}", "}")
-                
-                # Try parsing the fixed version
                 try:
-                    data = json.loads(content_fixed)
-                except json.JSONDecodeError:
-                    # If still failing, return empty list to continue workflow
+                    data = orjson.loads(content_fixed)
+                except orjson.JSONDecodeError:
                     self.logger.log_error("JSON repair failed, skipping this batch")
                     return []
             
-            # Clean up dictionary keys (remove newlines, extra quotes, etc)
-            if isinstance(data, dict):
-                clean_data = {}
-                for key, value in data.items():
-                    # Clean the key - remove newlines, quotes, extra spaces
-                    clean_key = key.strip().strip('\n').strip('\r').strip('"').strip("'").strip()
-                    clean_data[clean_key] = value
-                data = clean_data
-            
-            # Handle different response formats - be flexible with key names
-            personas_data = []
-            
-            if isinstance(data, list):
-                # Response is directly a list
-                personas_data = data
-            elif isinstance(data, dict):
-                # Look for personas in various possible keys
-                for key in data.keys():
-                    # Clean the key (remove whitespace, quotes, etc)
-                    clean_key = key.strip().strip('"').strip("'").lower()
-                    if 'persona' in clean_key:
-                        personas_data = data[key]
-                        break
-                
-                # If still not found, get first list value
-                if not personas_data:
-                    personas_data = next(
-                        (v for v in data.values() if isinstance(v, list)),
-                        []
-                    )
-            
-            # Convert to Persona objects
-            personas = []
-            for i, p_data in enumerate(personas_data):
-                try:
-                    persona = Persona(**p_data)
-                    personas.append(persona)
-                except Exception as e:
-                    self.logger.log_warning(f"Failed to parse persona {i+1}: {e}")
-                    # Log the actual data to help debug
-                    self.logger.log_warning(f"Persona data was: {str(p_data)[:200]}")
-                    continue
-            
-            return personas
-        
+            persona_dicts = self._extract_personas_from_response(data)
         except Exception as e:
-            self.logger.log_error("Persona batch generation failed", str(e))
-            # Return empty list to continue workflow
+            self.logger.log_error(f"{operation} failed", str(e))
             return []
+        
+        # Convert to Persona objects
+        personas = []
+        for i, p_data in enumerate(persona_dicts):
+            try:
+                personas.append(Persona(**p_data))
+            except Exception as e:
+                self.logger.log_warning(f"Failed to parse persona {i+1}: {e}")
+                self.logger.log_warning(f"Persona data was: {str(p_data)[:200]}")
+        
+        return personas
     
     def generate_targeted_personas(
         self,
@@ -586,53 +595,20 @@ Provide realistic personas that would be interested in products targeting this m
 
 Return a JSON array of persona objects."""
         
-        messages = [
-            {"role": "system", "content": self.system_prompt},
-            {"role": "user", "content": targeted_prompt}
-        ]
-        
-        try:
-            response = self.client.chat_completion(
-                model=self.model,
-                messages=messages,
-                temperature=self.temperature,
-                max_tokens=4000,
-                response_format={"type": "json_object"},
-            )
-            
-            content = response.choices[0].message.content
-            data = json.loads(content)
-            
-            # Parse personas
-            if "personas" in data:
-                personas_data = data["personas"]
-            elif isinstance(data, list):
-                personas_data = data
-            else:
-                personas_data = next(
-                    (v for v in data.values() if isinstance(v, list)),
-                    []
-                )
-            
-            personas = []
-            for p_data in personas_data:
-                try:
-                    persona = Persona(**p_data)
-                    personas.append(persona)
-                except Exception as e:
-                    self.logger.log_warning(f"Failed to parse persona: {e}")
-                    continue
-            
-            self.logger.log_agent_complete("Persona Generator")
-            return personas
-        
-        except Exception as e:
-            self.logger.log_error("Targeted persona generation failed", str(e))
+        self._seen_keys.clear()
+        personas = self._keep_unique(
+            self._do_batch_call(targeted_prompt, count, "Targeted persona generation")
+        )
+        if not personas:
             # Fallback to general personas
             return self.generate_personas(count)
+        
+        self.logger.log_agent_complete("Persona Generator")
+        return personas
     
     def clear_cache(self):
         """Clear persona cache."""
         self._persona_cache = []
+        self._seen_keys.clear()
         self.logger.log_info("Persona cache cleared")
 
@@ -1,14 +1,11 @@
 """Main CLI entry point for Product Ideation System."""
 
+import gc
+import sys
 import typer
 from typing import Optional
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
 
-from .orchestration import create_workflow
-from .post_composer import AssetBundler
-from .utils import get_config, get_logger, get_openrouter_client
+from . import __version__
 
 app = typer.Typer(
     name="product-ideation",
@@ -16,7 +13,23 @@ app = typer.Typer(
     add_completion=False,
 )
 
-console = Console()
+_console = None
+
+
+def _get_console():
+    """Create the Rich console on first use (avoids terminal probing at import)."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
+
+def __getattr__(name: str):
+    # Keep `src.main.console` working for callers that imported it directly
+    if name == "console":
+        return _get_console()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 @app.command()
@@ -25,6 +38,7 @@ def generate(
     iterations: Optional[int] = typer.Option(None, "--iterations", "-i", help="Maximum iterations (default: from config)"),
     pmf_threshold: Optional[float] = typer.Option(None, "--threshold", "-t", help="PMF threshold % (default: from config)"),
     personas: Optional[int] = typer.Option(None, "--personas", "-p", help="Number of personas to simulate (default: from config)"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Ignore cached personas and API responses from earlier runs"),
 ):
     """
     Generate and validate a product concept.
@@ -40,7 +54,15 @@ def generate(
     Example:
         product-ideation generate "AI-powered desk organizer for remote workers"
     """
+    from rich.panel import Panel
+    
+    console = _get_console()
+    
     try:
+        from .orchestration import create_workflow
+        from .post_composer import AssetBundler
+        from .utils import get_config, get_logger
+        
         # Load config
         config = get_config()
         logger = get_logger()
@@ -57,11 +79,16 @@ def generate(
         # Create and run workflow
         workflow = create_workflow()
         
+        # The workflow stack (langgraph, agents, SSR models) is now loaded; keep
+        # its long-lived objects out of future GC passes too
+        _freeze_gc()
+        
         final_state = workflow.run(
             seed_idea=seed_idea,
             max_iterations=iterations,
             pmf_threshold=pmf_threshold,
             personas_count=personas,
+            use_cache=not no_cache,
         )
         
         # Create output package
@@ -96,7 +123,13 @@ def config(
     Shows the active configuration including models, workflow parameters,
     and feature flags.
     """
+    from rich.table import Table
+    
+    console = _get_console()
+    
     try:
+        from .utils import get_config
+        
         cfg = get_config()
         
         console.print()
@@ -163,7 +196,13 @@ def costs():
     
     Shows token usage, API calls, and estimated costs for the current session.
     """
+    from rich.table import Table
+    
+    console = _get_console()
+    
     try:
+        from .utils import get_openrouter_client
+        
         client = get_openrouter_client()
         summary = client.get_cost_summary()
         
@@ -172,9 +211,9 @@ def costs():
         console.print()
         
         # Overall stats
-        stats_table = Table(title="Overall Statistics", show_header=True)
-        stats_table.add_column("Metric", style="cyan")
-        stats_table.add_column("Value", style="green")
+        stats_table = Table(title="Overall Statistics", show_header=True, expand=False)
+        stats_table.add_column("Metric", style="cyan", no_wrap=True)
+        stats_table.add_column("Value", style="green", no_wrap=True)
         
         stats_table.add_row("Total API Calls", str(summary["total_calls"]))
         stats_table.add_row("Successful Calls", str(summary["successful_calls"]))
@@ -185,11 +224,12 @@ def costs():
         
         # Per-model stats
         if summary["model_stats"]:
-            model_table = Table(title="Usage by Model", show_header=True)
-            model_table.add_column("Model", style="cyan")
-            model_table.add_column("Calls", style="green")
-            model_table.add_column("Input Tokens", style="yellow")
-            model_table.add_column("Output Tokens", style="yellow")
+            # Short single-line cells: no_wrap skips Rich's per-cell wrap measurement
+            model_table = Table(title="Usage by Model", show_header=True, expand=False)
+            model_table.add_column("Model", style="cyan", no_wrap=True)
+            model_table.add_column("Calls", style="green", justify="right", no_wrap=True)
+            model_table.add_column("Input Tokens", style="yellow", justify="right", no_wrap=True)
+            model_table.add_column("Output Tokens", style="yellow", justify="right", no_wrap=True)
             
             for model, stats in summary["model_stats"].items():
                 model_table.add_row(
@@ -210,15 +250,20 @@ def costs():
 @app.command()
 def version():
     """Display version information."""
+    console = _get_console()
     console.print()
     console.print("[bold blue]Product Ideation System[/bold blue]")
-    console.print("Version: 1.0.0")
+    console.print(f"Version: {__version__}")
     console.print("Python AI-powered product concept generation and market validation")
     console.print()
 
 
 def _display_results(package, logger):
     """Display final results summary."""
+    from rich.table import Table
+    
+    console = _get_console()
+    
     # Results table
     results_table = Table(title="Final Results", show_header=True, show_lines=True)
     results_table.add_column("Metric", style="cyan", width=30)
@@ -252,8 +297,22 @@ def _display_results(package, logger):
     console.print()
 
 
+def _freeze_gc():
+    """Move everything allocated so far to the permanent GC generation."""
+    gc.collect()
+    gc.freeze()
+
+
 def main():
     """Main entry point."""
+    # Answer version queries without building the Typer/Click command tree
+    if len(sys.argv) == 2 and sys.argv[1] in ("version", "--version", "-V"):
+        print(f"Product Ideation System {__version__}")
+        return
+    
+    # Import-time objects (Typer/Click/Rich, pydantic models) live for the whole
+    # process; stop the cyclic GC from rescanning them on every collection
+    _freeze_gc()
     app()
 
 
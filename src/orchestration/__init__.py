@@ -1,6 +1,10 @@
 """Orchestration modules for workflow management."""
 
-from .workflow import ProductIdeationWorkflow, create_workflow, WorkflowState
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .workflow import ProductIdeationWorkflow, create_workflow, WorkflowState
 
 __all__ = [
     "ProductIdeationWorkflow",
@@ -8,3 +12,22 @@ __all__ = [
     "WorkflowState",
 ]
 
+# The workflow module pulls in LangGraph and every agent, so it is imported
+# on first attribute access (PEP 562) rather than with the package.
+_LAZY = {
+    "ProductIdeationWorkflow": ".workflow",
+    "create_workflow": ".workflow",
+    "WorkflowState": ".workflow",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -1,18 +1,17 @@
 """LangGraph workflow for iterative product concept refinement."""
 
-from typing import TypedDict, Annotated, Sequence
-from langgraph.graph import StateGraph, END
+from typing import TYPE_CHECKING, TypedDict, Annotated, Sequence
+from pathlib import Path
+import hashlib
 import operator
+import orjson
 
-from ..agents import (
-    IdeatorAgent,
-    PersonaGenerator,
-    MarketPredictorAgent,
-    CriticAgent,
-)
+# Models stay at module scope: LangGraph resolves WorkflowState's type hints
+# at graph build time, and they are already loaded with the utils package.
 from ..utils import (
     get_config,
     get_logger,
+    get_openrouter_client,
     ProductConcept,
     Persona,
     PersonaResponse,
@@ -20,6 +19,9 @@ from ..utils import (
     CriticFeedback,
 )
 
+if TYPE_CHECKING:
+    from langgraph.graph import StateGraph
+
 
 class WorkflowState(TypedDict):
     """State for the LangGraph workflow."""
@@ -39,7 +41,9 @@ class WorkflowState(TypedDict):
     market_fit: MarketFitScore
     critic_feedback: CriticFeedback
     
-    # History
+    # History (one entry per iteration). Must stay a non-mutating reducer:
+    # LangGraph shallow-copies channels when evaluating conditional edges, so
+    # an in-place extend() would append every entry twice.
     history: Annotated[Sequence[dict], operator.add]
     
     # Control
@@ -65,17 +69,30 @@ class ProductIdeationWorkflow:
         self.config = get_config()
         self.logger = get_logger()
         
+        # Imported here so merely importing the orchestration package stays cheap
+        from ..agents import (
+            IdeatorAgent,
+            PersonaGenerator,
+            MarketPredictorAgent,
+            CriticAgent,
+        )
+        
         # Initialize agents
         self.ideator = IdeatorAgent()
         self.persona_gen = PersonaGenerator()
         self.market_predictor = MarketPredictorAgent()
         self.critic = CriticAgent()
         
+        # Reuse personas from earlier runs with the same settings
+        self.use_persona_cache = True
+        
         # Build graph
         self.graph = self._build_graph()
     
-    def _build_graph(self) -> StateGraph:
+    def _build_graph(self) -> "StateGraph":
         """Build the LangGraph workflow."""
+        from langgraph.graph import StateGraph, END
+        
         # Define workflow
         workflow = StateGraph(WorkflowState)
         
@@ -108,9 +125,52 @@ class ProductIdeationWorkflow:
         return workflow.compile()
     
     def _generate_personas_node(self, state: WorkflowState) -> dict:
-        """Generate personas for market simulation."""
-        personas = self.persona_gen.generate_personas(state["personas_count"])
-        return {"personas": personas}
+        """Generate personas for market simulation (reusing cached ones if available)."""
+        count = state["personas_count"]
+        cache_path = self._persona_cache_path(count) if self.use_persona_cache else None
+        
+        if cache_path is not None and cache_path.exists():
+            try:
+                personas = tuple(Persona.model_validate(p) for p in orjson.loads(cache_path.read_bytes()))
+                if len(personas) >= count:
+                    self.logger.log_info(f"Reusing {count} cached personas from {cache_path}")
+                    return {"personas": personas[:count]}
+            except Exception as e:
+                self.logger.log_warning(f"Ignoring unreadable persona cache {cache_path}: {e}")
+        
+        personas = self.persona_gen.generate_personas(count)
+        
+        if cache_path is not None:
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                cache_path.write_bytes(orjson.dumps([p.model_dump() for p in personas]))
+            except OSError as e:
+                self.logger.log_warning(f"Could not write persona cache: {e}")
+        
+        # Tuples let state snapshots alias the sequence instead of copying it
+        return {"personas": tuple(personas)}
+    
+    def _persona_cache_path(self, count: int) -> Path:
+        """
+        Cache file for personas generated with the current settings.
+        
+        The key covers everything that shapes the personas: count, model,
+        sampling temperature, the persona_generation section (strategy and
+        distributions) and the persona prompts, so editing any of them
+        starts a fresh cache entry.
+        """
+        key = orjson.dumps(
+            {
+                "count": count,
+                "model": self.config.persona_generator_model,
+                "temperature": self.config.get_setting("models", "persona_temperature", default=0.8),
+                "generation": self.config.get_setting("persona_generation", default={}),
+                "prompts": self.config.prompts.get("persona_generator", {}),
+            },
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+        )
+        digest = hashlib.sha256(key).hexdigest()[:16]
+        return self.config.cache_dir / "personas" / f"{digest}.json"
     
     def _ideate_node(self, state: WorkflowState) -> dict:
         """Generate or refine product concept."""
@@ -119,7 +179,7 @@ class ProductIdeationWorkflow:
             concept = self.ideator.generate_concept(state["seed_idea"])
         else:
             # Refine existing concept based on critic feedback
-            feedback = state["critic_feedback"].to_refinement_prompt()
+            feedback = state["critic_feedback"].refinement_prompt
             concept = self.ideator.refine_concept(
                 state["current_concept"],
                 feedback
@@ -135,12 +195,21 @@ class ProductIdeationWorkflow:
     
     def _simulate_market_node(self, state: WorkflowState) -> dict:
         """Simulate market response from personas."""
+        personas = state["personas"]
+        
+        # Optionally skip personas unrelated to the concept to save LLM calls
+        if self.config.get_setting("market_simulation", "relevance_filter", default=False):
+            fraction = self.config.get_setting("market_simulation", "relevance_fraction", default=0.5)
+            personas = self.market_predictor.select_relevant_personas(
+                state["current_concept"], personas, fraction
+            )
+        
         responses = self.market_predictor.simulate_market_response(
             state["current_concept"],
-            state["personas"]
+            personas
         )
         
-        return {"persona_responses": responses}
+        return {"persona_responses": tuple(responses)}
     
     def _calculate_pmf_node(self, state: WorkflowState) -> dict:
         """Calculate Product-Market Fit score."""
@@ -151,9 +220,9 @@ class ProductIdeationWorkflow:
         
         # Log iteration results
         self.logger.log_iteration(
-            state["iteration"],
-            market_fit.pmf_score,
-            state["current_concept"].name
+            iteration=state["iteration"],
+            pmf_score=market_fit.pmf_score,
+            concept_name=state["current_concept"].name,
         )
         
         # Add to history
@@ -204,6 +273,15 @@ class ProductIdeationWorkflow:
             )
             return {"should_continue": False}
         
+        # Stop early if refinement has stopped moving the PMF score
+        recent = [h["pmf_score"] for h in state["history"][-3:]]
+        if len(recent) >= 3 and max(recent) - min(recent) < self.config.pmf_plateau_epsilon:
+            self.logger.log_info(
+                f"PMF plateau detected (last {len(recent)} iterations within "
+                f"{self.config.pmf_plateau_epsilon} points) - finalizing"
+            )
+            return {"should_continue": False}
+        
         # Continue iterating
         self.logger.log_info(
             f"Continuing refinement (Iteration {state['iteration']}/{state['max_iterations']}, "
@@ -220,7 +298,8 @@ class ProductIdeationWorkflow:
         seed_idea: str,
         max_iterations: int = None,
         pmf_threshold: float = None,
-        personas_count: int = None
+        personas_count: int = None,
+        use_cache: bool = True
     ) -> WorkflowState:
         """
         Run the complete workflow.
@@ -230,10 +309,14 @@ class ProductIdeationWorkflow:
             max_iterations: Maximum refinement iterations
             pmf_threshold: PMF score threshold to reach
             personas_count: Number of personas to simulate
+            use_cache: Reuse personas and API responses cached by earlier runs
         
         Returns:
             Final WorkflowState
         """
+        self.use_persona_cache = use_cache
+        get_openrouter_client().use_response_cache = use_cache
+        
         # Use config defaults if not specified
         if max_iterations is None:
             max_iterations = self.config.max_iterations
@@ -253,8 +336,8 @@ class ProductIdeationWorkflow:
             "personas_count": personas_count,
             "iteration": 0,
             "current_concept": None,
-            "personas": [],
-            "persona_responses": [],
+            "personas": (),
+            "persona_responses": (),
             "market_fit": None,
             "critic_feedback": None,
             "history": [],
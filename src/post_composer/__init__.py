@@ -1,8 +1,12 @@
 """Social media post composition modules."""
 
-from .x_composer import XComposer
-from .linkedin_composer import LinkedInComposer
-from .asset_bundler import AssetBundler
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .x_composer import XComposer
+    from .linkedin_composer import LinkedInComposer
+    from .asset_bundler import AssetBundler
 
 __all__ = [
     "XComposer",
@@ -10,3 +14,22 @@ __all__ = [
     "AssetBundler",
 ]
 
+# Submodules are imported on first attribute access (PEP 562) so CLI paths
+# that never compose posts don't pay for matplotlib/seaborn and friends.
+_LAZY = {
+    "XComposer": ".x_composer",
+    "LinkedInComposer": ".linkedin_composer",
+    "AssetBundler": ".asset_bundler",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -1,26 +1,110 @@
 """Asset bundler - Package complete output with all materials."""
 
-from typing import Dict, List
+import asyncio
+import atexit
+import hashlib
+import inspect
+import math
+import os
+import shutil
+import string
+import threading
+from bisect import bisect_left
+import numpy as np
+import orjson
+from typing import Callable, ClassVar, Dict, List, Mapping, Set
 from pathlib import Path
 from datetime import datetime
-import json
 from collections import Counter
+from itertools import count
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
 
 from ..utils import (
     get_config,
     get_logger,
+    get_openrouter_client,
     FileManager,
     ProductConcept,
     MarketFitScore,
     WorkflowState,
     OutputPackage,
     Persona,
+    SocialMediaPost,
 )
+from .. import __version__
 from ..visualization import ImageGenerator, InfographicGenerator
 from .x_composer import XComposer
 from .linkedin_composer import LinkedInComposer
 
 
+# Persona age brackets (ages are validated >= 18) and their inclusive upper
+# bounds; anything past the last bound falls in the final bracket
+_AGE_BRACKETS = ("18-24", "25-34", "35-44", "45-54", "55-64", "65-74", "75-85")
+_AGE_BRACKET_UPPER_BOUNDS = (24, 34, 44, 54, 64, 74)
+
+# Fields written to the analytics debug files (output keeps model field order)
+_PERSONA_EXPORT_FIELDS = frozenset({
+    "name", "age", "occupation", "income_bracket", "location_type", "tech_savviness",
+    "values", "pain_points", "personality_traits", "shopping_behavior",
+})
+_RESPONSE_EXPORT_FIELDS = frozenset({
+    "persona_name", "interest_response", "purchase_intent_response", "disappointment_response",
+    "recommendation_response", "main_benefit", "concerns",
+})
+
+
+@lru_cache(maxsize=1)
+def _infographic_code_digest() -> bytes:
+    """Digest of the chart rendering module, so code/style edits invalidate cached PNGs."""
+    try:
+        source = Path(inspect.getsourcefile(InfographicGenerator)).read_bytes()
+    except (OSError, TypeError):
+        source = b""
+    return hashlib.blake2b(source, digest_size=16).digest()
+
+
+def _numbered_lines(items) -> str:
+    """Render items as a 1-based numbered list, one per line."""
+    return "\n".join(map("{}. {}".format, count(1), items))
+
+
+class _LazyFormatDict(dict):
+    """Mapping for str.format_map that builds derived fields on first use."""
+    
+    def __init__(self, values: Dict, **factories):
+        super().__init__(values)
+        self._factories = factories
+    
+    def __missing__(self, key: str):
+        value = self[key] = self._factories[key]()
+        return value
+
+
+def _compile_template(template: str) -> Callable[[Mapping], str]:
+    """Parse a str.format template once into a renderer taking a mapping."""
+    formatter = string.Formatter()
+    parts = []
+    for literal, field, spec, conversion in formatter.parse(template):
+        if field is not None and (not field.isidentifier() or "{" in spec):
+            # Positional/attribute/nested fields: leave those to str.format
+            return template.format_map
+        parts.append((literal, field, spec, conversion))
+    
+    def render(fields: Mapping) -> str:
+        out = []
+        for literal, field, spec, conversion in parts:
+            out.append(literal)
+            if field is not None:
+                value = fields[field]
+                if conversion:
+                    value = formatter.convert_field(value, conversion)
+                out.append(format(value, spec))
+        return "".join(out)
+    
+    return render
+
+
 class AssetBundler:
     """
     Package complete output folder with all marketing materials.
@@ -34,17 +118,57 @@ class AssetBundler:
     - analytics/ folder with metrics
     """
     
+    # Worker pools shared by every bundler in the process, created on first
+    # use. Chart renders get their own pool because the infographics step
+    # waits on them from inside a bundler worker.
+    _pools: ClassVar[Dict[str, ThreadPoolExecutor]] = {}
+    _pools_lock: ClassVar[threading.Lock] = threading.Lock()
+    
+    # Infographic cache folders known to be complete, shared by every
+    # bundler in the process so repeat bundles skip the existence checks
+    _infographic_cache_hits: ClassVar[Set[Path]] = set()
+    
     def __init__(self):
         """Initialize asset bundler."""
         self.config = get_config()
         self.logger = get_logger()
         self.file_manager = FileManager(self.config.output_base_dir)
         
-        # Initialize composers and generators
-        self.x_composer = XComposer()
-        self.linkedin_composer = LinkedInComposer()
-        self.image_gen = ImageGenerator()
+        # Charts are drawn for every bundle; the composers and the image
+        # generator are built on first use (viable products only)
         self.infographic_gen = InfographicGenerator()
+        
+        # Output templates are constant for the process; parse them once
+        self._render_readme = _compile_template(self.config.get_prompt("output", "readme_template"))
+        self._render_posting_guide = _compile_template(self.config.get_prompt("output", "posting_guide_template"))
+    
+    @cached_property
+    def x_composer(self) -> XComposer:
+        """X.com post composer, created on first use."""
+        return XComposer()
+    
+    @cached_property
+    def linkedin_composer(self) -> LinkedInComposer:
+        """LinkedIn post composer, created on first use."""
+        return LinkedInComposer()
+    
+    @cached_property
+    def image_gen(self) -> ImageGenerator:
+        """Product render generator, created on first use."""
+        return ImageGenerator()
+    
+    @classmethod
+    def _get_pool(cls, name: str, max_workers: int) -> ThreadPoolExecutor:
+        """Get (or start) the shared worker pool with the given name."""
+        pool = cls._pools.get(name)
+        if pool is None:
+            with cls._pools_lock:
+                pool = cls._pools.get(name)
+                if pool is None:
+                    pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+                    atexit.register(pool.shutdown, wait=False)
+                    cls._pools[name] = pool
+        return pool
     
     def create_complete_package(
         self,
@@ -65,29 +189,67 @@ class AssetBundler:
         market_fit = workflow_state["market_fit"]
         history = workflow_state["history"]
         
+        # Serialize the models once; the same bytes are written to disk and
+        # hashed for the post/infographic cache keys
+        concept_json = concept.model_dump_json(indent=2).encode()
+        market_fit_json = market_fit.model_dump_json(indent=2).encode() if market_fit else b"null"
+        
+        # One timestamp for the folder name, README and package metadata
+        created_at = datetime.now()
+        
         # Create output directory
-        output_dir = self.file_manager.create_output_directory(concept.name)
+        output_dir = self.file_manager.create_output_directory(concept.name, created_at)
         
         # Check if product is viable (using enhanced metrics)
         # Product is viable if it meets PMF threshold OR has 10%+ superfans (niche viability)
         pmf_score = market_fit.pmf_score if market_fit else 0
         pmf_threshold = workflow_state["pmf_threshold"]
-        is_viable = (pmf_score >= pmf_threshold) or (market_fit and market_fit.is_viable_niche())
+        meets_threshold = pmf_score >= pmf_threshold
+        niche_ok = bool(market_fit) and not meets_threshold and market_fit.is_viable_niche()
+        is_viable = meets_threshold or niche_ok
+        
+        # The bundle steps are independent I/O (image API, chart rendering, file
+        # writes), so run them side by side; only the posts wait on the images
+        pool = self._get_pool("bundler", max_workers=8)
         
         # 1. Generate images (only if viable and feature enabled)
-        image_files = []
+        images_future = None
         if is_viable and self.config.is_feature_enabled("enable_image_generation"):
-            image_files = self._generate_images(concept, output_dir)
+            images_future = pool.submit(self._generate_images, concept, output_dir)
         
         # 2. Generate infographics (always generate for analysis)
+        infographics_future = None
         if self.config.is_feature_enabled("enable_infographics"):
-            infographic_files = self._generate_infographics(market_fit, history, output_dir)
-            image_files.extend(infographic_files)
+            infographics_future = pool.submit(
+                self._generate_infographics, market_fit, market_fit_json, history, output_dir
+            )
         
-        # 3. Create social media posts (only if viable)
-        posts = []
+        # 4. Save concept data
+        concept_future = pool.submit(self._save_concept_data, concept_json, output_dir)
+        
+        # 5. Save analytics
+        analytics_future = pool.submit(self._save_analytics, workflow_state, market_fit_json, output_dir)
+        
+        # 6. Create README
+        readme_future = pool.submit(self._create_readme, workflow_state, output_dir, created_at)
+        
+        # 3. Compose social media posts (only if viable). The text doesn't
+        # depend on the renders, so both posts are written while they run
+        post_futures = {}
         if is_viable and self.config.is_feature_enabled("enable_social_posts"):
-            posts = self._create_social_posts(concept, market_fit, output_dir, image_files)
+            post_futures = {
+                "x": pool.submit(self.x_composer.compose_post, concept, market_fit),
+                "linkedin": pool.submit(self.linkedin_composer.compose_post, concept, market_fit),
+            }
+        
+        images_by_platform = images_future.result() if images_future else {}
+        image_files = list(images_by_platform.values())
+        
+        # Attach renders to the composed posts and save them
+        posts = []
+        if post_futures:
+            composed = {platform: future.result() for platform, future in post_futures.items()}
+            posts = self._create_social_posts(composed, output_dir, images_by_platform)
         elif not is_viable:
             if market_fit:
                 viability_msg = f"Product not viable (Traditional PMF: {pmf_score:.1f}%, Superfans: {market_fit.superfan_ratio*100:.1f}%)"
@@ -95,22 +257,19 @@ class AssetBundler:
                 viability_msg = f"PMF threshold not met ({pmf_score:.1f}% < {pmf_threshold}%)"
             self.logger.log_warning(f"{viability_msg} - skipping social media posts and product images")
         
-        # 4. Save concept data
-        self._save_concept_data(concept, output_dir)
-        
-        # 5. Save analytics
-        analytics_files = self._save_analytics(workflow_state, output_dir)
-        
-        # 6. Create README
-        self._create_readme(workflow_state, output_dir)
-        
         # 7. Create POSTING_GUIDE
         self._create_posting_guide(posts, output_dir)
         
+        if infographics_future:
+            image_files.extend(infographics_future.result())
+        concept_future.result()
+        analytics_files = analytics_future.result()
+        readme_future.result()
+        
         # Create output package metadata
         package = OutputPackage(
             product_name=concept.name,
-            timestamp=datetime.now().isoformat(),
+            timestamp=created_at.isoformat(),
             output_dir=str(output_dir),
             concept=concept,
             market_fit=market_fit,
@@ -124,9 +283,27 @@ class AssetBundler:
         self.logger.log_agent_complete("Asset Bundler")
         return package
     
-    def _generate_images(self, concept: ProductConcept, output_dir: Path) -> List[str]:
-        """Generate product images for all platforms."""
-        image_files = []
+    async def create_complete_package_async(
+        self,
+        workflow_state: WorkflowState
+    ) -> OutputPackage:
+        """
+        Create complete output package without blocking the event loop.
+        
+        Args:
+            workflow_state: Final workflow state with all data
+        
+        Returns:
+            OutputPackage with metadata
+        """
+        # The bundle is blocking file/network I/O already fanned out over a
+        # thread pool; run it off the loop so other coroutines keep going
+        return await asyncio.to_thread(self.create_complete_package, workflow_state)
+    
+    def _generate_images(self, concept: ProductConcept, output_dir: Path) -> Dict[str, str]:
+        """Generate product images for all platforms (platform -> saved path)."""
+        image_files = {}
+        images_dir = output_dir / "images"
         
         try:
             # Generate for different platforms
@@ -134,9 +311,9 @@ class AssetBundler:
             
             for platform, image_data in images.items():
                 filename = f"{platform}_product_render.png"
-                filepath = output_dir / "images" / filename
+                filepath = images_dir / filename
                 self.file_manager.save_image(image_data, filepath)
-                image_files.append(str(filepath))
+                image_files[platform] = str(filepath)
                 self.logger.log_info(f"Generated image: {filename}")
         
         except Exception as e:
@@ -147,235 +324,255 @@ class AssetBundler:
     def _generate_infographics(
         self,
         market_fit: MarketFitScore,
+        market_fit_json: bytes,
         history: List[Dict],
         output_dir: Path
     ) -> List[str]:
         """Generate infographic visualizations."""
         infographic_files = []
         
-        try:
-            # Market Segmentation Chart (NEW - shows distribution)
-            segmentation_path = output_dir / "images" / "market_segmentation.png"
-            self.infographic_gen.create_market_segmentation_chart(
-                market_fit,
-                save_path=segmentation_path
-            )
-            infographic_files.append(str(segmentation_path))
-            self.logger.log_info("Generated market segmentation chart")
-            
-            # PMF Dashboard
-            dashboard_path = output_dir / "images" / "pmf_dashboard.png"
-            self.infographic_gen.create_pmf_dashboard(
-                market_fit,
-                threshold=self.config.pmf_threshold,
-                save_path=dashboard_path
-            )
-            infographic_files.append(str(dashboard_path))
-            self.logger.log_info("Generated PMF dashboard")
-            
-            # Iteration history (if multiple iterations)
-            if len(history) > 1:
-                history_path = output_dir / "images" / "iteration_history.png"
-                self.infographic_gen.create_iteration_history(
-                    history,
-                    save_path=history_path
-                )
-                infographic_files.append(str(history_path))
-                self.logger.log_info("Generated iteration history")
+        # Each chart draws on its own Figure, so the renders can run side by side
+        charts = [
+            ("market_segmentation.png", "Generated market segmentation chart",
+             lambda path: self.infographic_gen.create_market_segmentation_chart(market_fit, save_path=path)),
+            ("pmf_dashboard.png", "Generated PMF dashboard",
+             lambda path: self.infographic_gen.create_pmf_dashboard(
+                 market_fit, threshold=self.config.pmf_threshold, save_path=path
+             )),
+        ]
         
+        # Iteration history (if multiple iterations)
+        if len(history) > 1:
+            charts.append(("iteration_history.png", "Generated iteration history",
+                           lambda path: self.infographic_gen.create_iteration_history(history, save_path=path)))
+        
+        names = [name for name, _, _ in charts]
+        images_dir = output_dir / "images"
+        targets = [images_dir / name for name in names]
+        
+        # Charts only depend on the market data, so identical inputs (re-runs,
+        # retries) reuse the PNGs rendered last time
+        cache_dir = None
+        if self.config.is_feature_enabled("enable_infographic_cache"):
+            cache_dir = self._infographic_cache_dir(market_fit_json, history)
+            if cache_dir in self._infographic_cache_hits or all((cache_dir / name).exists() for name in names):
+                try:
+                    for name, target in zip(names, targets):
+                        self.file_manager.copy_file(cache_dir / name, target)
+                    os.utime(cache_dir)  # Mark as recently used for eviction
+                    self._infographic_cache_hits.add(cache_dir)
+                    self.logger.log_info("Reused cached infographics")
+                    return [str(target) for target in targets]
+                except OSError as e:
+                    self._infographic_cache_hits.discard(cache_dir)
+                    self.logger.log_warning(f"Ignoring unreadable infographic cache {cache_dir}: {e}")
+        
+        pool = self._get_pool("infographic", max_workers=3)
+        
+        futures = [
+            (target, message, pool.submit(render, target))
+            for target, (_, message, render) in zip(targets, charts)
+        ]
+        try:
+            for target, message, future in futures:
+                future.result()
+                infographic_files.append(str(target))
+                self.logger.log_info(message)
         except Exception as e:
             self.logger.log_warning(f"Infographic generation failed: {e}")
         
+        if cache_dir is not None and len(infographic_files) == len(names):
+            try:
+                self.file_manager.ensure_dir(cache_dir)
+                for name, target in zip(names, targets):
+                    self.file_manager.copy_file(target, cache_dir / name)
+                self._infographic_cache_hits.add(cache_dir)
+                self._prune_infographic_cache(cache_dir.parent)
+            except OSError as e:
+                self.logger.log_warning(f"Could not cache infographics: {e}")
+        
         return infographic_files
     
+    def _infographic_cache_dir(self, market_fit_json: bytes, history: List[Dict]) -> Path:
+        """Cache folder for charts rendered from this market fit/history/threshold."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(__version__.encode())
+        digest.update(_infographic_code_digest())
+        digest.update(market_fit_json)
+        digest.update(orjson.dumps(history, default=str))
+        digest.update(str(self.config.pmf_threshold).encode())
+        return self.config.cache_dir / "infographics" / digest.hexdigest()
+    
+    def _prune_infographic_cache(self, cache_root: Path):
+        """Delete the least recently used chart folders beyond the configured limit."""
+        max_entries = self.config.get_setting("system", "infographic_cache_max_entries", default=50)
+        with os.scandir(cache_root) as entries:
+            folders = [entry for entry in entries if entry.is_dir()]
+        if len(folders) <= max_entries:
+            return
+        
+        folders.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+        for entry in folders[max_entries:]:
+            shutil.rmtree(entry.path, ignore_errors=True)
+            self._infographic_cache_hits.discard(Path(entry.path))
+    
     def _create_social_posts(
         self,
-        concept: ProductConcept,
-        market_fit: MarketFitScore,
+        composed: Dict[str, SocialMediaPost],
         output_dir: Path,
-        image_files: List[str]
+        images_by_platform: Dict[str, str]
     ) -> List:
-        """Create social media posts."""
+        """Attach product renders to composed posts and save them."""
         posts = []
+        posts_dir = output_dir / "posts"
         
-        # X.com post
-        x_post = self.x_composer.compose_post(concept, market_fit)
-        
-        # Add image paths
-        x_images = [f for f in image_files if "x_" in f]
-        if x_images:
-            x_post.image_paths = [x_images[0]]
-        
-        # Save X post
-        x_post_path = output_dir / "posts" / "x_post.md"
-        self._save_post(x_post, x_post_path)
-        posts.append(x_post)
-        
-        # LinkedIn post
-        linkedin_post = self.linkedin_composer.compose_post(concept, market_fit)
-        
-        # Add image paths
-        linkedin_images = [f for f in image_files if "linkedin_" in f]
-        if linkedin_images:
-            linkedin_post.image_paths = [linkedin_images[0]]
-        
-        # Save LinkedIn post
-        linkedin_post_path = output_dir / "posts" / "linkedin_post.md"
-        self._save_post(linkedin_post, linkedin_post_path)
-        posts.append(linkedin_post)
+        for platform, post in composed.items():
+            # Add image paths
+            if platform in images_by_platform:
+                post.image_paths = [images_by_platform[platform]]
+            
+            # Save post
+            self._save_post(post, posts_dir / f"{platform}_post.md")
+            posts.append(post)
         
         return posts
     
     def _save_post(self, post, filepath: Path):
         """Save social media post to markdown file."""
-        content = f"# {post.platform.upper()} Post\n\n"
-        content += f"**Character Count:** {post.char_count}/{280 if post.platform == 'x' else 3000}\n\n"
+        parts = [
+            f"# {post.platform.upper()} Post\n\n",
+            f"**Character Count:** {post.char_count}/{280 if post.platform == 'x' else 3000}\n\n",
+        ]
         
         if post.image_paths:
-            content += f"**Images:**\n"
-            for img in post.image_paths:
-                content += f"- {img}\n"
-            content += "\n"
+            parts.append("**Images:**\n")
+            parts.extend(f"- {img}\n" for img in post.image_paths)
+            parts.append("\n")
         
-        content += "---\n\n"
-        content += post.text
+        parts.append("---\n\n")
+        parts.append(post.text)
         
-        self.file_manager.save_text(content, filepath)
+        self.file_manager.save_text("".join(parts), filepath)
     
-    def _save_concept_data(self, concept: ProductConcept, output_dir: Path):
+    def _save_concept_data(self, concept_json: bytes, output_dir: Path):
         """Save concept as JSON."""
         concept_path = output_dir / "concept.json"
-        self.file_manager.save_json(concept.model_dump(), concept_path)
+        self.file_manager.save_json_bytes(concept_json, concept_path)
     
-    def _save_analytics(self, workflow_state: WorkflowState, output_dir: Path) -> List[str]:
+    def _save_analytics(self, workflow_state: WorkflowState, market_fit_json: bytes, output_dir: Path) -> List[str]:
         """Save analytics data."""
         analytics_files = []
         
+        # The analytics files are independent, so their writes overlap on a
+        # small pool of their own (these tasks never wait on other work)
+        writer = self._get_pool("writes", max_workers=4)
+        writes = []
+        analytics_dir = output_dir / "analytics"
+        
         # Market fit data
-        market_fit_path = output_dir / "analytics" / "market_fit.json"
-        self.file_manager.save_json(
-            workflow_state["market_fit"].model_dump(),
-            market_fit_path
-        )
+        market_fit_path = analytics_dir / "market_fit.json"
+        writes.append(writer.submit(self.file_manager.save_json_bytes, market_fit_json, market_fit_path))
         analytics_files.append(str(market_fit_path))
         
-        # Iteration history
-        history_path = output_dir / "analytics" / "iteration_history.json"
+        # Iteration history, streamed one iteration per line, plus a small
+        # index file for tools that expect a single JSON document
+        history_lines_path = analytics_dir / "iteration_history.jsonl"
+        iteration_count = self.file_manager.save_jsonl(workflow_state["history"], history_lines_path)
+        analytics_files.append(str(history_lines_path))
+        
+        history_path = analytics_dir / "iteration_history.json"
         self.file_manager.save_json(
-            {"iterations": workflow_state["history"]},
+            {"iterations_file": history_lines_path.name, "count": iteration_count},
             history_path
         )
         analytics_files.append(str(history_path))
         
         # Cost summary (if API client available)
         try:
-            from ..utils import get_openrouter_client
-            client = get_openrouter_client()
-            cost_summary = client.get_cost_summary()
+            cost_summary = get_openrouter_client().get_cost_summary()
             
-            cost_path = output_dir / "analytics" / "cost_summary.json"
+            cost_path = analytics_dir / "cost_summary.json"
             self.file_manager.save_json(cost_summary, cost_path)
             analytics_files.append(str(cost_path))
         except Exception as e:
             self.logger.log_warning(f"Could not save cost summary: {e}")
         
         # Save personas for debugging
-        personas_path = output_dir / "analytics" / "personas.json"
-        personas_data = [
-            {
-                "name": p.name,
-                "age": p.age,
-                "occupation": p.occupation,
-                "income_bracket": p.income_bracket,
-                "location_type": p.location_type,
-                "tech_savviness": p.tech_savviness,
-                "values": p.values,
-                "pain_points": p.pain_points,
-                "personality_traits": p.personality_traits,
-                "shopping_behavior": p.shopping_behavior
-            }
+        personas_path = analytics_dir / "personas.json"
+        personas_json = (
+            p.model_dump_json(include=_PERSONA_EXPORT_FIELDS, indent=2).encode()
             for p in workflow_state["personas"]
-        ]
-        self.file_manager.save_json(personas_data, personas_path)
+        )
+        writes.append(writer.submit(self.file_manager.save_json_array, personas_json, personas_path))
         analytics_files.append(str(personas_path))
         
         # Save persona distribution analytics
-        distribution_path = output_dir / "analytics" / "persona_distribution.json"
+        distribution_path = analytics_dir / "persona_distribution.json"
         distribution_analytics = self._calculate_persona_distribution(workflow_state["personas"])
-        self.file_manager.save_json(distribution_analytics, distribution_path)
+        writes.append(writer.submit(self.file_manager.save_json, distribution_analytics, distribution_path))
         analytics_files.append(str(distribution_path))
         
         # Save persona responses for debugging
-        responses_path = output_dir / "analytics" / "persona_responses.json"
-        responses_data = [
-            {
-                "persona_name": r.persona_name,
-                "interest_response": r.interest_response,
-                "purchase_intent_response": r.purchase_intent_response,
-                "disappointment_response": r.disappointment_response,
-                "recommendation_response": r.recommendation_response,
-                "main_benefit": r.main_benefit,
-                "concerns": r.concerns
-            }
+        responses_path = analytics_dir / "persona_responses.json"
+        responses_json = (
+            r.model_dump_json(include=_RESPONSE_EXPORT_FIELDS, indent=2).encode()
             for r in workflow_state["persona_responses"]
-        ]
-        self.file_manager.save_json(responses_data, responses_path)
+        )
+        writes.append(writer.submit(self.file_manager.save_json_array, responses_json, responses_path))
         analytics_files.append(str(responses_path))
         
+        # Surface any write error
+        for future in writes:
+            future.result()
+        
         return analytics_files
     
-    def _create_readme(self, workflow_state: WorkflowState, output_dir: Path):
+    def _create_readme(self, workflow_state: WorkflowState, output_dir: Path, created_at: datetime):
         """Create README.md with concept overview."""
         concept = workflow_state["current_concept"]
         market_fit = workflow_state["market_fit"]
         
-        # Load template
-        template = self.config.get_prompt("output", "readme_template")
-        
-        # Format lists
-        features_list = "\n".join(f"{i}. {feature}" for i, feature in enumerate(concept.features, 1))
-        differentiators_list = "\n".join(f"- {diff}" for diff in concept.differentiators)
-        top_benefits_list = "\n".join(f"{i}. {benefit}" for i, benefit in enumerate(market_fit.top_benefits, 1))
-        top_concerns_list = "\n".join(f"{i}. {concern}" for i, concern in enumerate(market_fit.top_concerns, 1))
+        # List sections are only built if the (configurable) template uses them
+        fields = _LazyFormatDict(
+            {
+                "product_name": concept.name,
+                "tagline": concept.tagline,
+                "target_market": concept.target_market,
+                "problem_solved": concept.problem_solved,
+                "pricing_model": concept.pricing_model,
+                "pmf_score": market_fit.pmf_score,
+                "pmf_threshold": self.config.pmf_threshold,
+                "nps": market_fit.nps,
+                "avg_interest": market_fit.avg_interest,
+                "iteration_count": workflow_state["iteration"],
+                "personas_count": len(workflow_state["personas"]),
+                "recommendation": market_fit.recommendation,
+                "ideator_model": self.config.ideator_model,
+                "market_predictor_model": self.config.market_predictor_model,
+                "timestamp": created_at.strftime("%Y-%m-%d %H:%M:%S"),
+            },
+            features_list=lambda: _numbered_lines(concept.features),
+            differentiators_list=lambda: "\n".join(map("- {}".format, concept.differentiators)),
+            top_benefits_list=lambda: _numbered_lines(market_fit.top_benefits),
+            top_concerns_list=lambda: _numbered_lines(market_fit.top_concerns),
+        )
         
         # Fill template
-        readme_content = template.format(
-            product_name=concept.name,
-            tagline=concept.tagline,
-            target_market=concept.target_market,
-            problem_solved=concept.problem_solved,
-            pricing_model=concept.pricing_model,
-            features_list=features_list,
-            differentiators_list=differentiators_list,
-            pmf_score=market_fit.pmf_score,
-            pmf_threshold=self.config.pmf_threshold,
-            nps=market_fit.nps,
-            avg_interest=market_fit.avg_interest,
-            iteration_count=workflow_state["iteration"],
-            personas_count=len(workflow_state["personas"]),
-            top_benefits_list=top_benefits_list,
-            top_concerns_list=top_concerns_list,
-            recommendation=market_fit.recommendation,
-            ideator_model=self.config.ideator_model,
-            market_predictor_model=self.config.market_predictor_model,
-            timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-        )
+        readme_content = self._render_readme(fields)
         
         readme_path = output_dir / "README.md"
         self.file_manager.save_text(readme_content, readme_path)
     
     def _create_posting_guide(self, posts, output_dir: Path):
         """Create POSTING_GUIDE.md with instructions."""
-        template = self.config.get_prompt("output", "posting_guide_template")
-        
         # Get char counts
         x_char_count = next((p.char_count for p in posts if p.platform == "x"), 0)
         linkedin_char_count = next((p.char_count for p in posts if p.platform == "linkedin"), 0)
         
-        guide_content = template.format(
-            x_char_count=x_char_count,
-            linkedin_char_count=linkedin_char_count,
-        )
+        guide_content = self._render_posting_guide({
+            "x_char_count": x_char_count,
+            "linkedin_char_count": linkedin_char_count,
+        })
         
         guide_path = output_dir / "POSTING_GUIDE.md"
         self.file_manager.save_text(guide_content, guide_path)
@@ -384,21 +581,14 @@ class AssetBundler:
         """Calculate demographic distribution analytics for personas."""
         total = len(personas)
         
-        # Age distribution
-        def get_age_bracket(age: int) -> str:
-            if 18 <= age <= 24: return "18-24"
-            elif 25 <= age <= 34: return "25-34"
-            elif 35 <= age <= 44: return "35-44"
-            elif 45 <= age <= 54: return "45-54"
-            elif 55 <= age <= 64: return "55-64"
-            elif 65 <= age <= 74: return "65-74"
-            else: return "75-85"
-        
-        age_dist = Counter([get_age_bracket(p.age) for p in personas])
-        income_dist = Counter([p.income_bracket for p in personas])
-        location_dist = Counter([p.location_type for p in personas])
-        tech_dist = Counter([p.tech_savviness for p in personas])
-        occupation_dist = Counter([p.occupation for p in personas])
+        # Tally every dimension in a single pass over the personas
+        age_dist, income_dist, location_dist, tech_dist, occupation_dist = (Counter() for _ in range(5))
+        for p in personas:
+            age_dist[_AGE_BRACKETS[bisect_left(_AGE_BRACKET_UPPER_BOUNDS, p.age)]] += 1
+            income_dist[p.income_bracket] += 1
+            location_dist[p.location_type] += 1
+            tech_dist[p.tech_savviness] += 1
+            occupation_dist[p.occupation] += 1
         
         # Load target distributions for comparison
         try:
@@ -454,12 +644,11 @@ class AssetBundler:
         """Calculate overall diversity score (0-100)."""
         # Higher score = more diverse (more even distribution)
         # Use Shannon entropy as diversity measure
-        import math
-        
         def entropy(dist: Counter, total: int) -> float:
-            if total == 0: return 0
-            probs = [count/total for count in dist.values()]
-            return -sum(p * math.log2(p) if p > 0 else 0 for p in probs)
+            if total == 0 or not dist: return 0
+            probs = np.fromiter(dist.values(), dtype=np.float64, count=len(dist)) / total
+            probs = probs[probs > 0]
+            return float(-(probs * np.log2(probs)).sum())
         
         # Calculate entropy for each dimension
         age_entropy = entropy(age_dist, total)
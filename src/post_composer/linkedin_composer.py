@@ -1,5 +1,6 @@
 """LinkedIn post composer."""
 
+import io
 from typing import List
 from ..utils import (
     get_config,
@@ -22,6 +23,13 @@ class LinkedInComposer:
     - Markdown formatting supported
     """
     
+    # Topic hashtags, in post order: a tag is added when any of its
+    # (concept field, lowercase keyword) rules matches
+    TOPIC_HASHTAGS = (
+        ("#TechInnovation", (("target_market", "tech"), ("name", "software"))),
+        ("#MarketResearch", (("problem_solved", "market"),)),
+    )
+    
     def __init__(self):
         """Initialize LinkedIn composer."""
         self.config = get_config()
@@ -30,6 +38,10 @@ class LinkedInComposer:
         self.max_chars = self.config.linkedin_max_chars
         self.optimal_length = self.config.get_setting("social_media", "linkedin", "optimal_length", default=1500)
         self.recommended_hashtags = self.config.get_setting("social_media", "linkedin", "hashtags_recommended", default=5)
+        
+        # Disclosure settings are fixed for the process
+        self.disclosure_template = self.config.linkedin_disclosure_template
+        self.methodology_link = self.config.methodology_link
     
     def compose_post(
         self,
@@ -48,89 +60,73 @@ class LinkedInComposer:
         """
         self.logger.log_agent_start("LinkedIn Composer", "Composing post")
         
-        # Build post with LinkedIn formatting
-        post_parts = []
+        # Write the post straight into one buffer
+        buf = io.StringIO()
+        w = buf.write
         
         # Title/Hook
-        post_parts.append(f"# Introducing: {concept.name}")
-        post_parts.append("")
-        post_parts.append(concept.tagline)
-        post_parts.append("")
+        w(f"# Introducing: {concept.name}\n\n{concept.tagline}\n\n")
         
         # The Problem
-        post_parts.append("## The Problem")
-        post_parts.append("")
-        post_parts.append(concept.problem_solved)
-        post_parts.append("")
-        post_parts.append(f"This challenge particularly affects **{concept.target_market}**.")
-        post_parts.append("")
+        w(f"## The Problem\n\n{concept.problem_solved}\n\n")
+        w(f"This challenge particularly affects **{concept.target_market}**.\n\n")
         
         # Our Solution
-        post_parts.append("## Our Solution")
-        post_parts.append("")
+        w("## Our Solution\n\n")
         for i, feature in enumerate(concept.features, 1):
-            post_parts.append(f"**{i}. {feature}**")
-        post_parts.append("")
+            w(f"**{i}. {feature}**\n")
+        w("\n")
         
         # Competitive Advantage
         if concept.differentiators:
-            post_parts.append("## What Makes It Different")
-            post_parts.append("")
+            w("## What Makes It Different\n\n")
             for diff in concept.differentiators[:3]:
-                post_parts.append(f"✅ {diff}")
-            post_parts.append("")
+                w(f"✅ {diff}\n")
+            w("\n")
         
         # Market Validation
-        post_parts.append("## Market Validation")
-        post_parts.append("")
-        post_parts.append(f"✅ **{market_fit.pmf_score:.1f}% Product-Market Fit** (Target: 40%+)")
-        post_parts.append(f"✅ **{market_fit.nps} Net Promoter Score**")
-        post_parts.append(f"✅ **{market_fit.avg_interest:.1f}/5.0 Average Interest**")
-        post_parts.append("")
+        w("## Market Validation\n\n")
+        w(f"✅ **{market_fit.pmf_score:.1f}% Product-Market Fit** (Target: 40%+)\n")
+        w(f"✅ **{market_fit.nps} Net Promoter Score**\n")
+        w(f"✅ **{market_fit.avg_interest:.1f}/5.0 Average Interest**\n\n")
         
         # Top Benefits
         if market_fit.top_benefits:
-            post_parts.append("**Top Benefits** identified by our market research:")
+            w("**Top Benefits** identified by our market research:\n")
             for benefit in market_fit.top_benefits[:3]:
-                post_parts.append(f"• {benefit}")
-            post_parts.append("")
+                w(f"• {benefit}\n")
+            w("\n")
         
         # Business Model
-        post_parts.append("## Business Model")
-        post_parts.append("")
-        post_parts.append(f"**Pricing Strategy:** {concept.pricing_model}")
-        post_parts.append("")
+        w(f"## Business Model\n\n**Pricing Strategy:** {concept.pricing_model}\n\n")
         
         # AI Disclosure
-        disclosure_template = self.config.linkedin_disclosure_template
-        methodology_link = self.config.methodology_link
-        personas_count = market_fit.total_responses
-        
-        disclosure = disclosure_template.format(
-            link=methodology_link,
-            personas_count=personas_count
+        disclosure = self.disclosure_template.format(
+            link=self.methodology_link,
+            personas_count=market_fit.total_responses
         )
-        post_parts.append(disclosure)
-        post_parts.append("")
+        w(f"{disclosure}\n\n")
         
         # Hashtags
         hashtags = self._generate_hashtags(concept)
-        hashtags_line = " ".join(hashtags)
-        post_parts.append(hashtags_line)
+        w(" ".join(hashtags))
         
-        # Combine all parts
-        post_text = "\n".join(post_parts)
+        post_text = buf.getvalue()
         
         # Check length and trim if needed
-        if len(post_text) > self.max_chars:
+        length = len(post_text)
+        if length > self.max_chars:
             # Remove some differentiators or benefits
             post_text = self._create_shorter_version(concept, market_fit, hashtags)
+            length = len(post_text)
+            if length > self.max_chars:
+                post_text = post_text[:self.max_chars]
         
-        # Create post object
+        # Create post object (char_count reports the untrimmed length)
         post = SocialMediaPost(
             platform="linkedin",
-            text=post_text[:self.max_chars],
-            char_count=len(post_text),
+            text=post_text,
+            char_count=length,
             image_paths=[],  # Will be populated by asset bundler
             hashtags=hashtags,
         )
@@ -145,48 +141,41 @@ class LinkedInComposer:
         hashtags: List[str]
     ) -> str:
         """Create shorter version if post exceeds limit."""
-        post_parts = []
+        buf = io.StringIO()
+        w = buf.write
         
-        post_parts.append(f"# {concept.name}")
-        post_parts.append("")
-        post_parts.append(concept.tagline)
-        post_parts.append("")
+        w(f"# {concept.name}\n\n{concept.tagline}\n\n")
         
-        post_parts.append("## The Challenge")
-        post_parts.append(concept.problem_solved)
-        post_parts.append("")
+        w(f"## The Challenge\n{concept.problem_solved}\n\n")
         
-        post_parts.append("## Key Features")
+        w("## Key Features\n")
         for i, feature in enumerate(concept.features[:3], 1):
-            post_parts.append(f"{i}. {feature}")
-        post_parts.append("")
+            w(f"{i}. {feature}\n")
+        w("\n")
         
-        post_parts.append("## Validation")
-        post_parts.append(f"✅ {market_fit.pmf_score:.1f}% PMF | {market_fit.nps} NPS")
-        post_parts.append("")
+        w(f"## Validation\n✅ {market_fit.pmf_score:.1f}% PMF | {market_fit.nps} NPS\n\n")
         
         # Disclosure
-        post_parts.append(f"🤖 AI-powered ideation with {market_fit.total_responses}+ synthetic personas.")
-        post_parts.append("")
+        w(f"🤖 AI-powered ideation with {market_fit.total_responses}+ synthetic personas.\n\n")
         
-        post_parts.append(" ".join(hashtags))
+        w(" ".join(hashtags))
         
-        return "\n".join(post_parts)
+        return buf.getvalue()
     
     def _generate_hashtags(self, concept: ProductConcept) -> List[str]:
         """Generate relevant hashtags (3-5)."""
-        hashtags = []
-        
         # Industry/category hashtags
-        hashtags.append("#ProductInnovation")
-        hashtags.append("#AIpowered")
-        
-        # Add specific tags based on concept
-        if "tech" in concept.target_market.lower() or "software" in concept.name.lower():
-            hashtags.append("#TechInnovation")
-        
-        if "market" in concept.problem_solved.lower():
-            hashtags.append("#MarketResearch")
+        hashtags = ["#ProductInnovation", "#AIpowered"]
+        
+        # Add specific tags based on concept (each field lowercased once)
+        lowered = {}
+        for tag, rules in self.TOPIC_HASHTAGS:
+            for field, keyword in rules:
+                if field not in lowered:
+                    lowered[field] = getattr(concept, field).lower()
+                if keyword in lowered[field]:
+                    hashtags.append(tag)
+                    break
         
         # Add product development tag
         hashtags.append("#ProductDevelopment")
@@ -208,28 +197,15 @@ class LinkedInComposer:
         Returns:
             Article introduction text
         """
-        intro_parts = []
-        
-        intro_parts.append(f"# The Story Behind {concept.name}")
-        intro_parts.append("")
-        intro_parts.append("## Innovation Through AI-Powered Ideation")
-        intro_parts.append("")
-        intro_parts.append(
-            f"In today's fast-paced market, identifying real problems and creating "
-            f"viable solutions requires more than intuition—it demands data-driven validation."
-        )
-        intro_parts.append("")
-        intro_parts.append(
+        return (
+            f"# The Story Behind {concept.name}\n\n"
+            "## Innovation Through AI-Powered Ideation\n\n"
+            "In today's fast-paced market, identifying real problems and creating "
+            "viable solutions requires more than intuition—it demands data-driven validation.\n\n"
             f"This is the story of how we developed **{concept.name}**, a product concept "
             f"that achieved a {market_fit.pmf_score:.1f}% product-market fit score through "
-            f"AI-powered market simulation."
+            "AI-powered market simulation.\n\n"
+            "## The Problem\n\n"
+            f"{concept.problem_solved}\n\n"
+            "[Continue reading...]"
         )
-        intro_parts.append("")
-        intro_parts.append("## The Problem")
-        intro_parts.append("")
-        intro_parts.append(concept.problem_solved)
-        intro_parts.append("")
-        intro_parts.append("[Continue reading...]")
-        
-        return "\n".join(intro_parts)
-
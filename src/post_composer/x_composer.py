@@ -21,6 +21,9 @@ class XComposer:
     - Image: 1200x675px (16:9)
     """
     
+    # Last-resort post when even the two-feature version is too long
+    SHORT_POST_TEMPLATE = "{opening}\n\n✅ {pmf:.0f}% market fit\n🤖 AI-powered ideation"
+    
     def __init__(self):
         """Initialize X composer."""
         self.config = get_config()
@@ -30,6 +33,10 @@ class XComposer:
         self.optimal_length = self.config.get_setting("social_media", "x", "optimal_length", default=100)
         self.max_hashtags = self.config.get_setting("social_media", "x", "hashtags_max", default=2)
         self.include_emoji = self.config.get_setting("social_media", "x", "include_emoji", default=True)
+        
+        # Disclosure text is fixed for the process; format it once
+        self.methodology_link = self.config.methodology_link
+        self.disclosure = "\n\n" + self.config.x_disclosure_template.format(link=self.methodology_link)
     
     def compose_post(
         self,
@@ -48,23 +55,15 @@ class XComposer:
         """
         self.logger.log_agent_start("X Composer", "Composing post")
         
-        # Build post components
-        components = []
-        
         # Opening with product name and tagline
         if self.include_emoji:
             opening = f"🚀 {concept.name}: {concept.tagline}"
         else:
             opening = f"{concept.name}: {concept.tagline}"
         
-        components.append(opening)
-        
         # Add top features (max 3, truncated)
-        features_text = "\n\nKey features:"
-        for i, feature in enumerate(concept.features[:3], 1):
-            # Truncate long features
-            feature_short = feature[:50] + "..." if len(feature) > 50 else feature
-            features_text += f"\n• {feature_short}"
+        top_features = concept.features[:3]
+        features_text = self._features_block(top_features, 50)
         
         # Market validation
         validation = f"\n\n✅ {market_fit.pmf_score:.0f}% market fit"
@@ -72,9 +71,7 @@ class XComposer:
             validation += f" | NPS: {market_fit.nps}"
         
         # AI disclosure
-        disclosure_template = self.config.x_disclosure_template
-        methodology_link = self.config.methodology_link
-        disclosure = "\n\n" + disclosure_template.format(link=methodology_link)
+        disclosure = self.disclosure
         
         # Assemble post
         post_text = opening + features_text + validation + disclosure
@@ -82,20 +79,13 @@ class XComposer:
         # Check length and truncate if needed
         if len(post_text) > self.max_chars:
             # Try removing one feature
-            features_text = "\n\nKey features:"
-            for feature in concept.features[:2]:
-                feature_short = feature[:40] + "..." if len(feature) > 40 else feature
-                features_text += f"\n• {feature_short}"
+            features_text = self._features_block(top_features[:2], 40)
             
             post_text = opening + features_text + validation + disclosure
         
         # Still too long? Simplify further
         if len(post_text) > self.max_chars:
-            post_text = (
-                f"{opening}\n\n"
-                f"✅ {market_fit.pmf_score:.0f}% market fit\n"
-                f"🤖 AI-powered ideation"
-            )
+            post_text = self.SHORT_POST_TEMPLATE.format(opening=opening, pmf=market_fit.pmf_score)
         
         # Extract hashtags (from target market or features)
         hashtags = self._generate_hashtags(concept)
@@ -112,15 +102,23 @@ class XComposer:
         self.logger.log_agent_complete("X Composer")
         return post
     
+    def _features_block(self, features: list, max_len: int) -> str:
+        """Bulleted "Key features" section, truncating each feature to max_len."""
+        lines = ["\n\nKey features:"]
+        lines.extend(
+            f"• {feature[:max_len]}..." if len(feature) > max_len else f"• {feature}"
+            for feature in features
+        )
+        return "\n".join(lines)
+    
     def _generate_hashtags(self, concept: ProductConcept) -> list:
         """Generate relevant hashtags (max 2)."""
-        hashtags = []
-        
         # Add innovation hashtag
-        hashtags.append("#Innovation")
+        hashtags = ["#Innovation"]
         
-        # Add product category or target market
-        if "AI" in concept.name or "ai" in concept.name.lower():
+        # Add product category or target market ("AI" in the name implies
+        # "ai" in its lowercase form, so one test covers both)
+        if "ai" in concept.name.lower():
             hashtags.append("#AI")
         elif "tech" in concept.target_market.lower():
             hashtags.append("#Tech")
@@ -146,39 +144,16 @@ class XComposer:
         """
         self.logger.log_agent_start("X Composer", "Composing thread")
         
-        thread = []
-        
         # Tweet 1: Introduction
         tweet1 = f"🚀 Introducing {concept.name}\n\n{concept.tagline}\n\nA thread on why this matters 🧵"
-        thread.append(SocialMediaPost(
-            platform="x",
-            text=tweet1,
-            char_count=len(tweet1),
-            image_paths=[],
-            hashtags=[],
-        ))
         
         # Tweet 2: Problem
         tweet2 = f"The Problem:\n\n{concept.problem_solved}\n\nThis affects {concept.target_market}"
-        thread.append(SocialMediaPost(
-            platform="x",
-            text=tweet2,
-            char_count=len(tweet2),
-            image_paths=[],
-            hashtags=[],
-        ))
         
         # Tweet 3: Solution (features)
-        tweet3 = f"Our Solution:\n\n"
-        for i, feature in enumerate(concept.features[:3], 1):
-            tweet3 += f"{i}. {feature[:60]}\n"
-        thread.append(SocialMediaPost(
-            platform="x",
-            text=tweet3[:280],
-            char_count=len(tweet3),
-            image_paths=[],
-            hashtags=[],
-        ))
+        parts = ["Our Solution:\n\n"]
+        parts.extend(f"{i}. {feature[:60]}\n" for i, feature in enumerate(concept.features[:3], 1))
+        tweet3 = "".join(parts)
         
         # Tweet 4: Validation
         tweet4 = (
@@ -188,29 +163,34 @@ class XComposer:
             f"✅ {market_fit.avg_interest:.1f}/5.0 Interest\n\n"
             f"Validated with {market_fit.total_responses}+ personas"
         )
-        thread.append(SocialMediaPost(
-            platform="x",
-            text=tweet4,
-            char_count=len(tweet4),
-            image_paths=[],
-            hashtags=[],
-        ))
         
         # Tweet 5: Call to action with disclosure
-        methodology_link = self.config.methodology_link
         tweet5 = (
             f"Want to learn more?\n\n"
             f"🤖 This concept was developed using AI-powered ideation\n"
-            f"📊 Full methodology: {methodology_link}\n\n"
+            f"📊 Full methodology: {self.methodology_link}\n\n"
             f"#Innovation #AIpowered"
         )
-        thread.append(SocialMediaPost(
-            platform="x",
-            text=tweet5,
-            char_count=len(tweet5),
-            image_paths=[],
-            hashtags=["#Innovation", "#AIpowered"],
-        ))
+        
+        # (text, char_count, hashtags) per tweet; tweet 3 is clipped but
+        # reports its full length
+        tweets = (
+            (tweet1, len(tweet1), []),
+            (tweet2, len(tweet2), []),
+            (tweet3[:280], len(tweet3), []),
+            (tweet4, len(tweet4), []),
+            (tweet5, len(tweet5), ["#Innovation", "#AIpowered"]),
+        )
+        thread = [
+            SocialMediaPost(
+                platform="x",
+                text=text,
+                char_count=char_count,
+                image_paths=[],
+                hashtags=hashtags,
+            )
+            for text, char_count, hashtags in tweets
+        ]
         
         self.logger.log_agent_complete("X Composer")
         return thread
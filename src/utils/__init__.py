@@ -8,6 +8,7 @@ from .models import (
     ProductConcept,
     Persona,
     PersonaResponse,
+    PersonaResponseBatch,
     MarketFitScore,
     MarketSegmentation,
     CriticFeedback,
@@ -45,6 +46,7 @@ __all__ = [
     "ProductConcept",
     "Persona",
     "PersonaResponse",
+    "PersonaResponseBatch",
     "MarketFitScore",
     "MarketSegmentation",
     "CriticFeedback",
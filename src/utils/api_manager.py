@@ -1,64 +1,154 @@
 """OpenRouter API manager with rate limiting, retry logic, and cost tracking."""
 
+import atexit
+import hashlib
+import importlib.util
 import os
+import re
+import sqlite3
+import threading
 import time
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from collections import deque
+from typing import Deque, List, Dict, Any, Optional
 from datetime import datetime
-import json
-from openai import OpenAI
+from pathlib import Path
+import orjson
+from openai import DefaultHttpxClient, OpenAI
+from openai.types.chat import ChatCompletion, ChatCompletionMessage
+from openai.types.chat.chat_completion import Choice
 from pydantic import BaseModel
 
 from .config_loader import get_config
+from .file_manager import FileManager
+from .exceptions import APIError, AuthenticationError, ModelNotFoundError, RateLimitError
 from .models import APICallLog
 
 
+# Image URLs in model output: markdown images first, plain URLs as fallback
+_MARKDOWN_IMAGE_URL_RE = re.compile(r'!\[.*?\]\((https?://[^\)]+)\)')
+_PLAIN_URL_RE = re.compile(r'https?://[^\s<>"{}|\\^`\[\]]+')
+
+# httpx only speaks HTTP/2 with the optional h2 package installed
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+@lru_cache(maxsize=64)
+def _schema_instruction(response_model: type[BaseModel]) -> str:
+    """System prompt suffix asking for JSON matching response_model's schema."""
+    schema = orjson.dumps(response_model.model_json_schema()).decode()
+    return f"\n\nYou must respond with valid JSON matching this schema:\n{schema}"
+
+
 class OpenRouterClient:
     """Wrapper for OpenRouter API with enhanced features."""
     
     def __init__(self):
         """Initialize OpenRouter client."""
-        from .exceptions import AuthenticationError
-        
         self.config = get_config()
         self.api_key = os.getenv("OPENROUTER_API_KEY")
         
         if not self.api_key:
             raise AuthenticationError()
         
-        # Initialize OpenAI client pointing to OpenRouter
+        # Initialize OpenAI client pointing to OpenRouter. One pooled HTTP
+        # client serves every call (HTTP/2 multiplexing when h2 is installed)
+        self._http = DefaultHttpxClient(http2=_HTTP2_AVAILABLE)
         self.client = OpenAI(
             base_url="https://openrouter.ai/api/v1",
             api_key=self.api_key,
+            http_client=self._http,
         )
+        atexit.register(self.close)
         
-        # Cost tracking
-        self.call_logs: List[APICallLog] = []
+        # Cost tracking: recent call logs plus running totals over all calls
+        self.call_logs: Deque[APICallLog] = deque(maxlen=self.config.api_call_log_limit)
         self.total_cost = 0.0
+        self._stats_lock = threading.Lock()
+        self._total_calls = 0
+        self._failed_calls = 0
+        self._model_stats: Dict[str, Dict[str, int]] = {}
         
         # Rate limiting
-        self.call_times: List[float] = []
+        self.call_times: Deque[int] = deque()  # time.monotonic_ns() of recent calls
         self.rate_limit = self.config.api_rate_limit
         self.rate_period = self.config.api_rate_period
+        self._rate_period_ns = int(self.rate_period * 1_000_000_000)
+        # A limit of 0 (or .inf) leaves throttling to the server's 429s
+        self._rate_enabled = 0 < self.rate_limit < float("inf")
+        self._rate_lock = threading.Lock()
+        
+        # Response cache (opened on first use; use_response_cache=False
+        # bypasses it for a fresh run even when enabled in settings)
+        self.use_response_cache = True
+        self._cache_db: Optional[sqlite3.Connection] = None
+        self._cache_lock = threading.Lock()
+    
+    def _response_cache(self) -> sqlite3.Connection:
+        """Open the on-disk response cache, creating it if needed."""
+        if self._cache_db is None:
+            cache_dir = self.config.cache_dir
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(cache_dir / "llm_responses.sqlite3", check_same_thread=False)
+            db.execute("CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, response TEXT NOT NULL)")
+            self._cache_db = db
+        return self._cache_db
+    
+    def _cache_key(self, model: str, messages: List[Dict[str, str]], **params) -> str:
+        """Content hash of everything that determines a completion."""
+        payload = orjson.dumps([model, messages, params], option=orjson.OPT_SORT_KEYS)
+        return hashlib.sha256(payload).hexdigest()
+    
+    def _get_cached_response(self, key: str) -> Optional[ChatCompletion]:
+        """Return a cached completion for key, if any."""
+        try:
+            with self._cache_lock:
+                row = self._response_cache().execute(
+                    "SELECT response FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+            return ChatCompletion.model_validate_json(row[0]) if row else None
+        except Exception:
+            # A broken cache should never break the run
+            return None
+    
+    def _store_cached_response(self, key: str, response: ChatCompletion):
+        """Persist a completion under key."""
+        try:
+            with self._cache_lock:
+                db = self._response_cache()
+                db.execute(
+                    "INSERT OR REPLACE INTO responses (key, response) VALUES (?, ?)",
+                    (key, response.model_dump_json()),
+                )
+                db.commit()
+        except Exception as e:
+            print(f"Could not cache API response: {e}")
     
     def _check_rate_limit(self):
-        """Check and enforce rate limiting."""
-        now = time.time()
-        
-        # Remove old calls outside the rate period
-        self.call_times = [t for t in self.call_times if now - t < self.rate_period]
-        
-        # Check if we're at the limit
-        if len(self.call_times) >= self.rate_limit:
-            # Calculate wait time
-            oldest_call = min(self.call_times)
-            wait_time = self.rate_period - (now - oldest_call)
-            if wait_time > 0:
-                print(f"Rate limit reached. Waiting {wait_time:.1f}s...")
-                time.sleep(wait_time)
-                self.call_times = []
+        """Check and enforce rate limiting (safe to call from worker threads)."""
+        if not self._rate_enabled:
+            return
         
-        # Record this call
-        self.call_times.append(time.time())
+        with self._rate_lock:
+            now = time.monotonic_ns()
+            
+            # Remove old calls outside the rate period (oldest are on the left)
+            while self.call_times and now - self.call_times[0] >= self._rate_period_ns:
+                self.call_times.popleft()
+            
+            # Check if we're at the limit
+            if len(self.call_times) >= self.rate_limit:
+                # Calculate wait time
+                oldest_call = self.call_times[0]
+                wait_ns = self._rate_period_ns - (now - oldest_call)
+                if wait_ns > 0:
+                    wait_time = wait_ns / 1e9
+                    print(f"Rate limit reached. Waiting {wait_time:.1f}s...")
+                    time.sleep(wait_time)
+                    self.call_times.clear()
+            
+            # Record this call
+            self.call_times.append(time.monotonic_ns())
     
     def _retry_with_backoff(self, func, max_retries: Optional[int] = None):
         """Execute function with exponential backoff retry."""
@@ -93,6 +183,19 @@ class OpenRouterClient:
         )
         
         self.call_logs.append(log_entry)
+        
+        with self._stats_lock:
+            self._total_calls += 1
+            if not success:
+                self._failed_calls += 1
+                return
+            
+            stats = self._model_stats.get(model)
+            if stats is None:
+                stats = self._model_stats[model] = {"calls": 0, "input_tokens": 0, "output_tokens": 0}
+            stats["calls"] += 1
+            stats["input_tokens"] += input_tokens or 0
+            stats["output_tokens"] += output_tokens or 0
     
     def chat_completion(
         self,
@@ -101,6 +204,7 @@ class OpenRouterClient:
         temperature: float = 0.7,
         max_tokens: int = 4000,
         response_format: Optional[Dict] = None,
+        stream: bool = False,
     ) -> Dict[str, Any]:
         """
         Call chat completion API with rate limiting and retry.
@@ -111,10 +215,29 @@ class OpenRouterClient:
             temperature: Sampling temperature
             max_tokens: Maximum tokens to generate
             response_format: Optional response format (e.g., {"type": "json_object"})
+            stream: Receive the response incrementally and assemble it locally
         
         Returns:
             API response dict
         """
+        # Identical low-temperature requests are served from the disk cache;
+        # hotter sampling is left alone to keep persona responses diverse
+        cache_key = None
+        if (
+            self.use_response_cache
+            and self.config.api_cache_responses
+            and temperature <= self.config.api_cache_max_temperature
+        ):
+            cache_key = self._cache_key(
+                model, messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                response_format=response_format,
+            )
+            cached = self._get_cached_response(cache_key)
+            if cached is not None:
+                return cached
+        
         self._check_rate_limit()
         
         def _call():
@@ -128,6 +251,11 @@ class OpenRouterClient:
             if response_format:
                 kwargs["response_format"] = response_format
             
+            if stream:
+                kwargs["stream"] = True
+                kwargs["stream_options"] = {"include_usage": True}
+                return self._collect_stream(self.client.chat.completions.create(**kwargs))
+            
             response = self.client.chat.completions.create(**kwargs)
             return response
         
@@ -143,11 +271,12 @@ class OpenRouterClient:
                 success=True,
             )
             
+            if cache_key is not None:
+                self._store_cached_response(cache_key, response)
+            
             return response
         
         except Exception as e:
-            from .exceptions import RateLimitError, AuthenticationError, ModelNotFoundError, APIError
-            
             # Log failed call
             self._log_call(
                 model=model,
@@ -172,6 +301,37 @@ class OpenRouterClient:
             else:
                 raise APIError(f"API call failed: {str(e)}") from e
     
+    def _collect_stream(self, stream) -> ChatCompletion:
+        """Assemble streamed chunks into a regular ChatCompletion."""
+        parts: List[str] = []
+        first = None
+        finish_reason = "stop"
+        usage = None
+        
+        for chunk in stream:
+            if first is None:
+                first = chunk
+            if chunk.usage is not None:
+                usage = chunk.usage
+            for choice in chunk.choices:
+                if choice.delta.content:
+                    parts.append(choice.delta.content)
+                if choice.finish_reason:
+                    finish_reason = choice.finish_reason
+        
+        return ChatCompletion.model_construct(
+            id=first.id if first else "",
+            object="chat.completion",
+            created=first.created if first else int(time.time()),
+            model=first.model if first else "",
+            choices=[Choice.model_construct(
+                index=0,
+                finish_reason=finish_reason,
+                message=ChatCompletionMessage.model_construct(role="assistant", content="".join(parts)),
+            )],
+            usage=usage,
+        )
+    
     def chat_completion_with_structured_output(
         self,
         model: str,
@@ -179,6 +339,7 @@ class OpenRouterClient:
         response_model: type[BaseModel],
         temperature: float = 0.7,
         max_tokens: int = 4000,
+        stream: bool = False,
     ) -> BaseModel:
         """
         Call chat completion with structured Pydantic output.
@@ -189,22 +350,27 @@ class OpenRouterClient:
             response_model: Pydantic model class for response
             temperature: Sampling temperature
             max_tokens: Maximum tokens
+            stream: Stream the response (see chat_completion)
         
         Returns:
             Parsed Pydantic model instance
         """
-        # Add JSON formatting instruction to system message
-        system_msg = next((m for m in messages if m["role"] == "system"), None)
-        
-        json_instruction = f"\n\nYou must respond with valid JSON matching this schema:\n{response_model.model_json_schema()}"
-        
-        if system_msg:
-            system_msg["content"] += json_instruction
+        # Add JSON formatting instruction to system message (on a copy, so
+        # the caller's messages are left untouched)
+        json_instruction = _schema_instruction(response_model)
+        # By convention the system message, if any, comes first
+        system_msg = messages[0] if messages and messages[0].get("role") == "system" else None
+        
+        if system_msg is not None:
+            messages = [
+                {**system_msg, "content": system_msg["content"] + json_instruction},
+                *messages[1:],
+            ]
         else:
-            messages.insert(0, {
-                "role": "system",
-                "content": f"You are a helpful assistant.{json_instruction}"
-            })
+            messages = [
+                {"role": "system", "content": f"You are a helpful assistant.{json_instruction}"},
+                *messages,
+            ]
         
         response = self.chat_completion(
             model=model,
@@ -212,13 +378,14 @@ class OpenRouterClient:
             temperature=temperature,
             max_tokens=max_tokens,
             response_format={"type": "json_object"},
+            stream=stream,
         )
         
         # Parse response into Pydantic model
         content = response.choices[0].message.content
         
         try:
-            data = json.loads(content)
+            data = orjson.loads(content)
             return response_model(**data)
         except Exception as e:
             print(f"Failed to parse response as {response_model.__name__}: {e}")
@@ -281,13 +448,11 @@ class OpenRouterClient:
             urls = self._extract_image_urls_from_markdown(content)
             
             if not urls:
-                self.logger.log_warning(f"No image URLs found in response: {content[:200]}")
+                print(f"No image URLs found in response: {content[:200]}")
             
             return urls
         
         except Exception as e:
-            from .exceptions import ImageGenerationError
-            
             # Log failed call
             self._log_call(
                 model=model,
@@ -305,17 +470,8 @@ class OpenRouterClient:
     
     def _extract_image_urls_from_markdown(self, content: str) -> List[str]:
         """Extract image URLs from markdown content."""
-        import re
-        # Look for markdown images: ![alt](url)
-        markdown_pattern = r'!\[.*?\]\((https?://[^\)]+)\)'
-        urls = re.findall(markdown_pattern, content)
-        
-        # Also look for plain URLs
-        if not urls:
-            url_pattern = r'https?://[^\s<>"{}|\\^`\[\]]+'
-            urls = re.findall(url_pattern, content)
-        
-        return urls
+        # Look for markdown images: ![alt](url), else fall back to plain URLs
+        return _MARKDOWN_IMAGE_URL_RE.findall(content) or _PLAIN_URL_RE.findall(content)
     
     def get_cost_summary(self) -> Dict[str, Any]:
         """
@@ -324,55 +480,53 @@ class OpenRouterClient:
         Returns:
             Dict with cost breakdown
         """
-        successful_calls = [log for log in self.call_logs if log.success]
-        failed_calls = [log for log in self.call_logs if not log.success]
-        
-        # Group by model
-        calls_by_model = {}
-        for log in successful_calls:
-            if log.model not in calls_by_model:
-                calls_by_model[log.model] = []
-            calls_by_model[log.model].append(log)
-        
-        # Calculate token usage by model
-        model_stats = {}
-        for model, logs in calls_by_model.items():
-            total_input = sum(log.input_tokens or 0 for log in logs)
-            total_output = sum(log.output_tokens or 0 for log in logs)
-            model_stats[model] = {
-                "calls": len(logs),
-                "input_tokens": total_input,
-                "output_tokens": total_output,
+        # Totals are kept up to date by _log_call, so this is a snapshot
+        with self._stats_lock:
+            return {
+                "total_calls": self._total_calls,
+                "successful_calls": self._total_calls - self._failed_calls,
+                "failed_calls": self._failed_calls,
+                "model_stats": {model: dict(stats) for model, stats in self._model_stats.items()},
             }
-        
-        return {
-            "total_calls": len(self.call_logs),
-            "successful_calls": len(successful_calls),
-            "failed_calls": len(failed_calls),
-            "model_stats": model_stats,
-        }
     
     def save_logs(self, filepath: str):
         """Save API call logs to JSON file."""
-        logs_data = [log.model_dump() for log in self.call_logs]
-        
-        with open(filepath, 'w') as f:
-            json.dump(logs_data, f, indent=2)
+        # Snapshot first since worker threads may still be logging
+        logs = list(self.call_logs)
+        filepath = Path(filepath)
+        FileManager(str(filepath.parent)).save_json_array(
+            (log.model_dump_json(indent=2).encode() for log in logs), filepath
+        )
+    
+    def close(self):
+        """Close pooled connections."""
+        self._http.close()
     
     def clear_logs(self):
         """Clear API call logs."""
-        self.call_logs = []
-        self.total_cost = 0.0
+        with self._stats_lock:
+            self.call_logs.clear()
+            self.total_cost = 0.0
+            self._total_calls = 0
+            self._failed_calls = 0
+            self._model_stats = {}
 
 
 # Global client instance
 _client: Optional[OpenRouterClient] = None
+_client_lock = threading.Lock()
 
 
 def get_openrouter_client() -> OpenRouterClient:
-    """Get global OpenRouter client instance."""
+    """Get global OpenRouter client instance (safe to call from worker threads)."""
     global _client
-    if _client is None:
-        _client = OpenRouterClient()
-    return _client
+    client = _client
+    if client is not None:
+        return client
+    
+    # Only the first calls contend; once built, the fast path above is lock-free
+    with _client_lock:
+        if _client is None:
+            _client = OpenRouterClient()
+        return _client
 
@@ -1,14 +1,103 @@
 """Configuration loader for settings and prompts."""
 
+import copy
 import os
 import yaml
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional
 from dotenv import load_dotenv
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
+
+@lru_cache(maxsize=8)
+def _load_yaml_cached(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a YAML file; the mtime is part of the key so edits are picked up."""
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=_SafeLoader) or {}
+
+
+def _validate_settings(settings: Dict[str, Any]) -> None:
+    """Validate required settings sections and values."""
+    from .exceptions import ConfigurationError
+    
+    # Validate required settings sections
+    required_sections = ["models", "workflow", "social_media"]
+    for section in required_sections:
+        if section not in settings:
+            raise ConfigurationError(f"Missing required configuration section: {section}")
+    
+    # Validate workflow parameters
+    workflow = settings.get("workflow", {})
+    
+    max_iterations = workflow.get("max_iterations", 5)
+    if not isinstance(max_iterations, int) or max_iterations < 1:
+        raise ConfigurationError(
+            f"workflow.max_iterations must be a positive integer, got: {max_iterations}"
+        )
+    if max_iterations > 10:
+        raise ConfigurationError(
+            f"workflow.max_iterations is set to {max_iterations}. "
+            f"Values > 10 may be expensive and have diminishing returns. "
+            f"Recommended: 3-5"
+        )
+    
+    pmf_threshold = workflow.get("pmf_threshold", 40.0)
+    if not isinstance(pmf_threshold, (int, float)) or pmf_threshold < 0 or pmf_threshold > 100:
+        raise ConfigurationError(
+            f"workflow.pmf_threshold must be between 0 and 100, got: {pmf_threshold}"
+        )
+    
+    personas_count = workflow.get("personas_count", 100)
+    if not isinstance(personas_count, int) or personas_count < 10:
+        raise ConfigurationError(
+            f"workflow.personas_count must be at least 10 for statistical validity, got: {personas_count}. "
+            f"Recommended: 50-100 for reliable results."
+        )
+    if personas_count > 500:
+        raise ConfigurationError(
+            f"workflow.personas_count is set to {personas_count}. "
+            f"Values > 500 may be very expensive and slow. "
+            f"Are you sure you want this many personas?"
+        )
+    
+    # Validate model names exist
+    models = settings.get("models", {})
+    required_models = ["ideator", "market_predictor", "critic", "persona_generator"]
+    for model_key in required_models:
+        if not models.get(model_key):
+            raise ConfigurationError(
+                f"Missing required model configuration: models.{model_key}"
+            )
+    
+    # Validate temperature values
+    ideator_temp = models.get("ideator_temperature", 0.7)
+    if not isinstance(ideator_temp, (int, float)) or ideator_temp < 0 or ideator_temp > 2:
+        raise ConfigurationError(
+            f"models.ideator_temperature must be between 0 and 2, got: {ideator_temp}"
+        )
+
+
+@lru_cache(maxsize=8)
+def _load_settings_cached(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse and validate settings once per file version (failures aren't cached)."""
+    settings = _load_yaml_cached(path, mtime_ns)
+    _validate_settings(settings)
+    return settings
+
 
 class Config:
-    """Central configuration manager."""
+    """
+    Central configuration manager.
+    
+    Settings accessors are cached per instance: settings don't change
+    after loading (reload_config() builds a new Config), so each value is
+    looked up once and then read as a plain attribute.
+    """
     
     def __init__(self, config_dir: Optional[Path] = None):
         """
@@ -29,26 +118,28 @@ class Config:
         # Load environment variables
         load_dotenv()
         
-        # Load configurations
-        self.settings = self._load_yaml(self.settings_path)
-        self.prompts = self._load_yaml(self.prompts_path)
+        # Load configurations (settings are validated as they're loaded;
+        # prompts wait until something asks for one)
+        self.settings = self._load_yaml(self.settings_path, validate=True)
+        self._prompts: Optional[Dict[str, Any]] = None
         
-        # Validate required settings
+        # Validate credentials
         self._validate()
     
-    def _load_yaml(self, path: Path) -> Dict[str, Any]:
-        """Load YAML file."""
+    def _load_yaml(self, path: Path, validate: bool = False) -> Dict[str, Any]:
+        """Load YAML file (parsed once per file version; each instance gets its own copy)."""
+        loader = _load_settings_cached if validate else _load_yaml_cached
         try:
-            with open(path, 'r') as f:
-                return yaml.safe_load(f) or {}
+            # Copy so a caller mutating its settings can't leak into the cache
+            return copy.deepcopy(loader(str(path), path.stat().st_mtime_ns))
         except FileNotFoundError:
             raise FileNotFoundError(f"Configuration file not found: {path}")
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML in {path}: {e}")
     
     def _validate(self):
-        """Validate required configuration fields and values."""
-        from .exceptions import ConfigurationError, AuthenticationError
+        """Validate the API key (checked on every load, since .env may change)."""
+        from .exceptions import AuthenticationError
         
         # Check for OpenRouter API key
         api_key = os.getenv("OPENROUTER_API_KEY")
@@ -66,174 +157,130 @@ class Config:
                 "OpenRouter keys should start with 'sk-or-v1-'. "
                 "Please check your .env file."
             )
-        
-        # Validate required settings sections
-        required_sections = ["models", "workflow", "social_media"]
-        for section in required_sections:
-            if section not in self.settings:
-                raise ConfigurationError(f"Missing required configuration section: {section}")
-        
-        # Validate workflow parameters
-        workflow = self.settings.get("workflow", {})
-        
-        max_iterations = workflow.get("max_iterations", 5)
-        if not isinstance(max_iterations, int) or max_iterations < 1:
-            raise ConfigurationError(
-                f"workflow.max_iterations must be a positive integer, got: {max_iterations}"
-            )
-        if max_iterations > 10:
-            raise ConfigurationError(
-                f"workflow.max_iterations is set to {max_iterations}. "
-                f"Values > 10 may be expensive and have diminishing returns. "
-                f"Recommended: 3-5"
-            )
-        
-        pmf_threshold = workflow.get("pmf_threshold", 40.0)
-        if not isinstance(pmf_threshold, (int, float)) or pmf_threshold < 0 or pmf_threshold > 100:
-            raise ConfigurationError(
-                f"workflow.pmf_threshold must be between 0 and 100, got: {pmf_threshold}"
-            )
-        
-        personas_count = workflow.get("personas_count", 100)
-        if not isinstance(personas_count, int) or personas_count < 10:
-            raise ConfigurationError(
-                f"workflow.personas_count must be at least 10 for statistical validity, got: {personas_count}. "
-                f"Recommended: 50-100 for reliable results."
-            )
-        if personas_count > 500:
-            raise ConfigurationError(
-                f"workflow.personas_count is set to {personas_count}. "
-                f"Values > 500 may be very expensive and slow. "
-                f"Are you sure you want this many personas?"
-            )
-        
-        # Validate model names exist
-        models = self.settings.get("models", {})
-        required_models = ["ideator", "market_predictor", "critic", "persona_generator"]
-        for model_key in required_models:
-            if not models.get(model_key):
-                raise ConfigurationError(
-                    f"Missing required model configuration: models.{model_key}"
-                )
-        
-        # Validate temperature values
-        ideator_temp = models.get("ideator_temperature", 0.7)
-        if not isinstance(ideator_temp, (int, float)) or ideator_temp < 0 or ideator_temp > 2:
-            raise ConfigurationError(
-                f"models.ideator_temperature must be between 0 and 2, got: {ideator_temp}"
-            )
     
     # Model configurations
-    @property
+    @cached_property
     def ideator_model(self) -> str:
         """Get ideator model name."""
         return self.settings["models"]["ideator"]
     
-    @property
+    @cached_property
     def ideator_temperature(self) -> float:
         """Get ideator temperature."""
         return self.settings["models"]["ideator_temperature"]
     
-    @property
+    @cached_property
     def market_predictor_model(self) -> str:
         """Get market predictor model name."""
         return self.settings["models"]["market_predictor"]
     
-    @property
+    @cached_property
     def critic_model(self) -> str:
         """Get critic model name."""
         return self.settings["models"]["critic"]
     
-    @property
+    @cached_property
     def persona_generator_model(self) -> str:
         """Get persona generator model name."""
         return self.settings["models"]["persona_generator"]
     
-    @property
+    @cached_property
     def image_generator_model(self) -> str:
         """Get image generator model name."""
         return self.settings["models"]["image_generator"]
     
-    @property
+    @cached_property
     def fallback_model(self) -> str:
         """Get fallback model name."""
         return self.settings["models"]["fallback_model"]
     
     # Workflow configurations
-    @property
+    @cached_property
     def max_iterations(self) -> int:
         """Get maximum workflow iterations."""
         return self.settings["workflow"]["max_iterations"]
     
-    @property
+    @cached_property
     def pmf_threshold(self) -> float:
         """Get PMF score threshold."""
         return self.settings["workflow"]["pmf_threshold"]
     
-    @property
+    @cached_property
     def personas_count(self) -> int:
         """Get number of personas to generate."""
         return self.settings["workflow"]["personas_count"]
     
+    @cached_property
+    def pmf_plateau_epsilon(self) -> float:
+        """Get minimum PMF spread over the last 3 iterations required to keep refining."""
+        return self.get_setting("workflow", "pmf_plateau_epsilon", default=0.5)
+    
     # SSR (Semantic Similarity Rating) configurations
-    @property
+    @cached_property
     def ssr_embedding_model(self) -> str:
         """Get SSR embedding model."""
         return self.get_setting("ssr", "embedding_model", default="all-mpnet-base-v2")
     
-    @property
+    @cached_property
     def ssr_temperature(self) -> float:
         """Get SSR temperature parameter."""
         return float(self.get_setting("ssr", "temperature", default=1.0))
     
-    @property
+    @cached_property
     def ssr_epsilon(self) -> float:
         """Get SSR epsilon regularization parameter."""
         return float(self.get_setting("ssr", "epsilon", default=0.01))
     
     # Social media configurations
-    @property
+    @cached_property
     def x_max_chars(self) -> int:
         """Get X.com character limit."""
         return self.settings["social_media"]["x"]["max_characters"]
     
-    @property
+    @cached_property
     def linkedin_max_chars(self) -> int:
         """Get LinkedIn character limit."""
         return self.settings["social_media"]["linkedin"]["max_characters"]
     
-    @property
+    @cached_property
     def x_image_size(self) -> tuple:
         """Get X.com image dimensions."""
         return tuple(self.settings["social_media"]["x"]["image_size"])
     
-    @property
+    @cached_property
     def linkedin_image_size(self) -> tuple:
         """Get LinkedIn image dimensions."""
         return tuple(self.settings["social_media"]["linkedin"]["image_size"])
     
     # Ethics configurations
-    @property
+    @cached_property
     def ai_disclosure_enabled(self) -> bool:
         """Check if AI disclosure is enabled."""
         return self.settings["ethics"]["ai_disclosure"]
     
-    @property
+    @cached_property
     def x_disclosure_template(self) -> str:
         """Get X.com AI disclosure template."""
         return self.settings["ethics"]["x_disclosure"]
     
-    @property
+    @cached_property
     def linkedin_disclosure_template(self) -> str:
         """Get LinkedIn AI disclosure template."""
         return self.settings["ethics"]["linkedin_disclosure"]
     
-    @property
+    @cached_property
     def methodology_link(self) -> str:
         """Get methodology documentation link."""
         return self.settings["ethics"]["methodology_link"]
     
     # Prompt templates
+    @property
+    def prompts(self) -> Dict[str, Any]:
+        """Get prompt templates, loading prompts.yaml on first access."""
+        if self._prompts is None:
+            self._prompts = self._load_yaml(self.prompts_path)
+        return self._prompts
+    
     def get_prompt(self, agent: str, prompt_type: str) -> str:
         """
         Get prompt template.
@@ -256,39 +303,65 @@ class Config:
         return self.settings.get("features", {}).get(feature, False)
     
     # API configurations
-    @property
+    @cached_property
     def api_rate_limit(self) -> int:
         """Get API rate limit calls per period."""
         return self.settings["api"]["rate_limit_calls"]
     
-    @property
+    @cached_property
     def api_rate_period(self) -> int:
         """Get API rate limit period in seconds."""
         return self.settings["api"]["rate_limit_period"]
     
-    @property
+    @cached_property
     def api_retry_attempts(self) -> int:
         """Get number of retry attempts."""
         return self.settings["api"]["retry_attempts"]
     
-    @property
+    @cached_property
     def api_timeout(self) -> int:
         """Get API timeout in seconds."""
         return self.settings["api"]["timeout"]
     
+    @cached_property
+    def api_max_concurrency(self) -> int:
+        """Get maximum number of API requests allowed in flight at once."""
+        return self.get_setting("api", "max_concurrent_requests", default=4)
+    
+    @cached_property
+    def api_cache_responses(self) -> bool:
+        """Check whether identical low-temperature API responses are cached on disk."""
+        return bool(self.get_setting("api", "cache_responses", default=False))
+    
+    @cached_property
+    def api_cache_max_temperature(self) -> float:
+        """Get the highest sampling temperature whose responses may be cached."""
+        return self.get_setting("api", "cache_max_temperature", default=0.3)
+    
+    @cached_property
+    def api_call_log_limit(self) -> int:
+        """Get how many recent API call logs are kept in memory."""
+        return self.get_setting("api", "call_log_limit", default=10000)
+    
     # Output configurations
-    @property
+    @cached_property
     def output_base_dir(self) -> str:
         """Get base output directory."""
         return self.settings["system"]["output_base_dir"]
     
+    @cached_property
+    def cache_dir(self) -> Path:
+        """Get directory for cross-run caches (personas, API responses)."""
+        cache_dir = self.get_setting("system", "cache_dir", default="~/.cache/product-ideation")
+        return Path(cache_dir).expanduser()
+    
     # Logging configurations
-    @property
+    @cached_property
     def log_level(self) -> str:
         """Get logging level."""
         return self.settings["logging"]["level"]
     
-    @property
+    @cached_property
     def track_costs(self) -> bool:
         """Check if cost tracking is enabled."""
         return self.settings["logging"]["track_costs"]
@@ -328,8 +401,13 @@ def get_config() -> Config:
 
 
 def reload_config():
-    """Reload configuration from files."""
+    """Reload configuration from files, re-parsing and re-validating them."""
     global _config
+    # Don't trust mtimes alone: an edit within the filesystem's timestamp
+    # granularity would otherwise be missed. Only repeated Config()
+    # constructions reuse the cached parse and validation.
+    _load_yaml_cached.cache_clear()
+    _load_settings_cached.cache_clear()
     _config = Config()
     return _config
 
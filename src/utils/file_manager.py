@@ -1,16 +1,47 @@
 """File management utilities for output organization."""
 
 import os
-import json
+import orjson
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterable, List, Optional, Set
 import shutil
 
 
+# Spaces become underscores, characters invalid in filenames are dropped
+_FILENAME_TABLE = str.maketrans({" ": "_", **dict.fromkeys('<>:"/\\|?*')})
+
+# Buffer for writers that emit many small chunks (JSON arrays / lines)
+_STREAM_BUFFER_SIZE = 1 << 20
+
+
+@contextmanager
+def _atomic_open(filepath: Path, mode: str = 'wb', **kwargs):
+    """
+    Open a sibling temp file and move it over filepath once fully written.
+    
+    A crash or exception mid-write leaves any previous file untouched
+    instead of a truncated one.
+    """
+    filepath = Path(filepath)
+    tmp_path = filepath.with_name(filepath.name + ".tmp")
+    try:
+        with open(tmp_path, mode, **kwargs) as f:
+            yield f
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
 class FileManager:
     """Manage file I/O and output directory structure."""
     
+    # Subfolders created for every output package
+    OUTPUT_SUBDIRS = ("images", "posts", "analytics")
+    
     def __init__(self, base_output_dir: str = "outputs"):
         """
         Initialize file manager.
@@ -20,13 +51,17 @@ class FileManager:
         """
         self.base_output_dir = Path(base_output_dir)
         self.base_output_dir.mkdir(exist_ok=True)
+        
+        # Directories known to exist, so ensure_dir can skip the syscall
+        self._known_dirs: Set[Path] = {self.base_output_dir}
     
-    def create_output_directory(self, product_name: str) -> Path:
+    def create_output_directory(self, product_name: str, created_at: Optional[datetime] = None) -> Path:
         """
         Create timestamped output directory for a product concept.
         
         Args:
             product_name: Name of the product
+            created_at: Timestamp for the folder name (defaults to now)
         
         Returns:
             Path to created directory
@@ -35,21 +70,23 @@ class FileManager:
         clean_name = self._sanitize_filename(product_name)
         
         # Create timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = (created_at or datetime.now()).strftime("%Y%m%d_%H%M%S")
         
         # Create directory name
         dir_name = f"{clean_name}_{timestamp}"
         output_dir = self.base_output_dir / dir_name
         
-        # Create directory structure
-        output_dir.mkdir(parents=True, exist_ok=True)
-        (output_dir / "images").mkdir(exist_ok=True)
-        (output_dir / "posts").mkdir(exist_ok=True)
-        (output_dir / "analytics").mkdir(exist_ok=True)
+        # Create directory structure in one pass (parents covers output_dir)
+        for subdir in self.OUTPUT_SUBDIRS:
+            (output_dir / subdir).mkdir(parents=True, exist_ok=True)
+        self._known_dirs.add(output_dir)
+        self._known_dirs.update(output_dir / subdir for subdir in self.OUTPUT_SUBDIRS)
         
         return output_dir
     
-    def _sanitize_filename(self, name: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _sanitize_filename(name: str) -> str:
         """
         Sanitize filename by removing invalid characters.
         
@@ -59,20 +96,10 @@ class FileManager:
         Returns:
             Sanitized filename
         """
-        # Replace spaces with underscores
-        name = name.replace(" ", "_")
-        
-        # Remove invalid characters
-        invalid_chars = '<>:"/\\|?*'
-        for char in invalid_chars:
-            name = name.replace(char, "")
-        
-        # Limit length
+        # Replace spaces and remove invalid characters in one pass,
+        # then limit length
         max_length = 50
-        if len(name) > max_length:
-            name = name[:max_length]
-        
-        return name.lower()
+        return name.translate(_FILENAME_TABLE)[:max_length].lower()
     
     def save_json(self, data: Dict[str, Any], filepath: Path):
         """
@@ -82,8 +109,75 @@ class FileManager:
             data: Data to save
             filepath: Path to save file
         """
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # orjson writes UTF-8 directly and handles numpy values / non-str keys;
+        # anything else unknown (datetimes aside) falls back to str()
+        raw = orjson.dumps(
+            data,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+            default=str,
+        )
+        with _atomic_open(filepath) as f:
+            f.write(raw)
+    
+    def save_json_bytes(self, raw: bytes, filepath: Path):
+        """
+        Save already-serialized JSON to file.
+        
+        Args:
+            raw: Encoded JSON document
+            filepath: Path to save file
+        """
+        with _atomic_open(filepath) as f:
+            f.write(raw)
+    
+    def save_json_array(self, items: Iterable[bytes], filepath: Path) -> int:
+        """
+        Save already-serialized JSON documents as one indented JSON array.
+        
+        Items are written as they are produced, so the whole array never
+        sits in memory. Each item should be indented by 2 spaces (e.g.
+        ``model_dump_json(indent=2)``); the output then matches save_json.
+        
+        Args:
+            items: Encoded JSON documents
+            filepath: Path to save file
+        
+        Returns:
+            Number of items written
+        """
+        count = 0
+        with _atomic_open(filepath, buffering=_STREAM_BUFFER_SIZE) as f:
+            for item in items:
+                f.write(b",\n  " if count else b"[\n  ")
+                f.write(item.replace(b"\n", b"\n  "))
+                count += 1
+            f.write(b"\n]" if count else b"[]")
+        return count
+    
+    def save_jsonl(self, records: Iterable[Dict[str, Any]], filepath: Path) -> int:
+        """
+        Save records as JSON Lines, one compact document per line.
+        
+        Records are serialized and written one at a time, so memory stays
+        flat however long the sequence is.
+        
+        Args:
+            records: Records to save
+            filepath: Path to save file
+        
+        Returns:
+            Number of records written
+        """
+        count = 0
+        with _atomic_open(filepath, buffering=_STREAM_BUFFER_SIZE) as f:
+            for record in records:
+                f.write(orjson.dumps(
+                    record,
+                    option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+                    default=str,
+                ))
+                count += 1
+        return count
     
     def save_text(self, content: str, filepath: Path):
         """
@@ -93,7 +187,7 @@ class FileManager:
             content: Text content
             filepath: Path to save file
         """
-        with open(filepath, 'w', encoding='utf-8') as f:
+        with _atomic_open(filepath, 'w', encoding='utf-8') as f:
             f.write(content)
     
     def save_image(self, image_data: bytes, filepath: Path):
@@ -104,7 +198,7 @@ class FileManager:
             image_data: Image bytes
             filepath: Path to save file
         """
-        with open(filepath, 'wb') as f:
+        with _atomic_open(filepath) as f:
             f.write(image_data)
     
     def load_json(self, filepath: Path) -> Dict[str, Any]:
@@ -117,8 +211,7 @@ class FileManager:
         Returns:
             Loaded data
         """
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return orjson.loads(Path(filepath).read_bytes())
     
     def load_text(self, filepath: Path) -> str:
         """
@@ -143,10 +236,10 @@ class FileManager:
         if not self.base_output_dir.exists():
             return []
         
-        return [
-            d.name for d in self.base_output_dir.iterdir()
-            if d.is_dir()
-        ]
+        # DirEntry carries the file type from the directory read, so no
+        # per-entry stat is needed
+        with os.scandir(self.base_output_dir) as entries:
+            return [entry.name for entry in entries if entry.is_dir()]
     
     def get_latest_output(self) -> Path:
         """
@@ -155,13 +248,14 @@ class FileManager:
         Returns:
             Path to latest output
         """
-        outputs = list(self.base_output_dir.iterdir())
+        with os.scandir(self.base_output_dir) as entries:
+            outputs = [entry for entry in entries if entry.is_dir()]
         if not outputs:
             raise FileNotFoundError("No output directories found")
         
         # Sort by modification time
-        latest = max(outputs, key=lambda p: p.stat().st_mtime)
-        return latest
+        latest = max(outputs, key=lambda entry: entry.stat().st_mtime)
+        return Path(latest.path)
     
     def copy_file(self, src: Path, dest: Path):
         """Copy file from src to dest."""
@@ -169,5 +263,8 @@ class FileManager:
     
     def ensure_dir(self, path: Path):
         """Ensure directory exists."""
+        if path in self._known_dirs:
+            return
         path.mkdir(parents=True, exist_ok=True)
+        self._known_dirs.add(path)
 
@@ -56,7 +56,7 @@ class SystemLogger:
             ))
             self.console.print()
         else:
-            self.logger.info(f"Starting workflow with seed: {seed_idea}")
+            self.logger.info("Starting workflow with seed: %s", seed_idea)
         
         self.events.append({
             "event": "workflow_start",
@@ -69,8 +69,12 @@ class SystemLogger:
         if self.console:
             self.console.print(f"[bold cyan]Iteration {iteration}[/bold cyan]: "
                              f"{concept_name} - PMF: [bold]{pmf_score:.1f}%[/bold]")
-        else:
-            self.logger.info(f"Iteration {iteration}: {concept_name} - PMF: {pmf_score}%")
+        elif self.logger.isEnabledFor(logging.INFO):
+            # Lazy %-formatting plus raw fields for structured handlers
+            self.logger.info(
+                "Iteration %d: %s - PMF: %s%%", iteration, concept_name, pmf_score,
+                extra={"iteration": iteration, "concept_name": concept_name, "pmf_score": pmf_score},
+            )
         
         self.events.append({
             "event": "iteration",
@@ -85,14 +89,14 @@ class SystemLogger:
         if self.console:
             self.console.print(f"  [yellow]→[/yellow] {agent_name}: {operation}...")
         else:
-            self.logger.info(f"{agent_name} - {operation}")
+            self.logger.info("%s - %s", agent_name, operation)
     
     def log_agent_complete(self, agent_name: str):
         """Log agent operation complete."""
         if self.console:
             self.console.print(f"  [green]✓[/green] {agent_name} complete")
         else:
-            self.logger.info(f"{agent_name} complete")
+            self.logger.info("%s complete", agent_name)
     
     def log_pmf_results(self, pmf_score: float, nps: int, avg_interest: float,
                        threshold: float, meets_threshold: bool, market_fit=None):
@@ -169,7 +173,7 @@ class SystemLogger:
             self.console.print(table)
             self.console.print()
         else:
-            self.logger.info(f"PMF: {pmf_score}%, NPS: {nps}, Interest: {avg_interest}/5.0")
+            self.logger.info("PMF: %s%%, NPS: %s, Interest: %s/5.0", pmf_score, nps, avg_interest)
     
     def log_workflow_complete(self, output_dir: str, iterations: int, final_pmf: float):
         """Log workflow completion."""
@@ -188,7 +192,7 @@ class SystemLogger:
             ))
             self.console.print()
         else:
-            self.logger.info(f"Workflow complete - PMF: {final_pmf}%, Iterations: {iterations}")
+            self.logger.info("Workflow complete - PMF: %s%%, Iterations: %s", final_pmf, iterations)
         
         self.events.append({
             "event": "workflow_complete",
@@ -209,7 +213,10 @@ class SystemLogger:
             self.console.print(Panel(error_text, border_style="red"))
             self.console.print()
         else:
-            self.logger.error(f"{error} - {details}" if details else error)
+            if details:
+                self.logger.error("%s - %s", error, details)
+            else:
+                self.logger.error("%s", error)
         
         self.events.append({
             "event": "error",
@@ -223,14 +230,14 @@ class SystemLogger:
         if self.console:
             self.console.print(f"[yellow]⚠️  Warning:[/yellow] {message}")
         else:
-            self.logger.warning(message)
+            self.logger.warning("%s", message)
     
     def log_info(self, message: str):
         """Log info message."""
         if self.console:
             self.console.print(f"[blue]ℹ️  {message}[/blue]")
         else:
-            self.logger.info(message)
+            self.logger.info("%s", message)
     
     def create_progress_bar(self, description: str, total: int) -> Progress:
         """Create Rich progress bar."""
@@ -1,6 +1,7 @@
 """Pydantic data models for the Product Ideation System."""
 
-from typing import List, Optional, Dict, Any
+from functools import cached_property
+from typing import List, Optional, Dict, Any, Tuple
 from pydantic import BaseModel, Field
 from enum import Enum
 
@@ -60,6 +61,10 @@ class Persona(BaseModel):
             "persona_tech_level": self.tech_savviness,
             "persona_personality": self.personality_traits,
         }
+    
+    def identity_key(self) -> Tuple[str, int, str]:
+        """Key identifying the same persona across batches (case/whitespace-insensitive)."""
+        return (self.name.strip().casefold(), self.age, self.occupation.strip().casefold())
 
 
 class PersonaResponse(BaseModel):
@@ -82,6 +87,11 @@ class PersonaResponse(BaseModel):
     concerns: List[str] = Field(description="Top concerns/hesitations")
 
 
+class PersonaResponseBatch(BaseModel):
+    """Responses from several personas returned by a single API call."""
+    responses: List[PersonaResponse] = Field(description="One response per persona, in the order asked")
+
+
 class MarketSegmentation(BaseModel):
     """Market segmentation analysis."""
     superfans_pct: float = Field(description="% with 5/5 interest + VERY disappointed (target market)")
@@ -207,8 +217,9 @@ class CriticFeedback(BaseModel):
     )
     strategic_direction: str = Field(description="Overall strategy recommendation")
     
-    def to_refinement_prompt(self) -> str:
-        """Convert feedback to prompt for Ideator refinement."""
+    @cached_property
+    def refinement_prompt(self) -> str:
+        """Prompt for Ideator refinement (built once per feedback instance)."""
         feedback = "**Strengths to Amplify:**\n"
         for strength in self.strengths_to_amplify:
             feedback += f"- {strength}\n"
@@ -226,6 +237,10 @@ class CriticFeedback(BaseModel):
         feedback += f"\n**Strategic Direction:** {self.strategic_direction}"
         
         return feedback
+    
+    def to_refinement_prompt(self) -> str:
+        """Convert feedback to prompt for Ideator refinement."""
+        return self.refinement_prompt
 
 
 class WorkflowState(BaseModel):
@@ -284,6 +299,8 @@ class SocialMediaPost(BaseModel):
 
 class OutputPackage(BaseModel):
     """Complete output package metadata."""
+    model_config = {"frozen": True}
+    
     product_name: str
     timestamp: str
     output_dir: str
@@ -2,6 +2,7 @@
 
 from typing import List, Tuple, Optional
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 import requests
 from io import BytesIO
 
@@ -158,17 +159,21 @@ Emphasize the problem it solves: {concept.problem_solved}"""
         """
         self.logger.log_agent_start("Image Generator", "Generating for all platforms")
         
-        images = {}
+        # X.com and LinkedIn. OpenRouter image models take one prompt per
+        # request, so issue the renders side by side instead of back to back
+        platforms = ("x", "linkedin")
         
-        # X.com
-        x_images = self.generate_product_render(concept, platform="x", num_images=1)
-        if x_images:
-            images["x"] = x_images[0]
+        def render(platform: str) -> List[bytes]:
+            return self.generate_product_render(concept, platform=platform, num_images=1)
         
-        # LinkedIn
-        linkedin_images = self.generate_product_render(concept, platform="linkedin", num_images=1)
-        if linkedin_images:
-            images["linkedin"] = linkedin_images[0]
+        with ThreadPoolExecutor(max_workers=len(platforms)) as pool:
+            renders = list(pool.map(render, platforms))
+        
+        images = {
+            platform: platform_images[0]
+            for platform, platform_images in zip(platforms, renders)
+            if platform_images
+        }
         
         self.logger.log_agent_complete("Image Generator")
         return images
@@ -4,6 +4,7 @@ from typing import List, Dict
 from pathlib import Path
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
+from matplotlib.figure import Figure
 import seaborn as sns
 from io import BytesIO
 
@@ -14,10 +15,18 @@ from ..utils import (
 )
 
 
+# Fast zlib level for chart PNGs: several times quicker to encode than the
+# default (6) for a slightly larger file
+_PNG_PIL_KWARGS = {"compress_level": 1}
+
+
 class InfographicGenerator:
     """
     Generate data visualizations and infographics for market analysis.
     Uses matplotlib and seaborn for professional-grade charts.
+    
+    Charts are built on standalone Figure objects rather than pyplot's global
+    figure state, so different charts can be rendered from different threads.
     """
     
     def __init__(self):
@@ -46,7 +55,8 @@ class InfographicGenerator:
         Returns:
             Image data as bytes
         """
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
+        fig = Figure(figsize=(14, 6))
+        ax1, ax2 = fig.subplots(1, 2)
         fig.suptitle('Market Segmentation Analysis', fontsize=16, fontweight='bold')
         
         # Interest Distribution Histogram
@@ -114,19 +124,19 @@ class InfographicGenerator:
                 color=viability_color,
                 bbox=dict(boxstyle='round,pad=0.5', facecolor='white', edgecolor=viability_color, linewidth=2))
         
-        plt.tight_layout()
+        fig.tight_layout()
+        
+        # Render once; the same bytes are saved and returned
+        buf = BytesIO()
+        fig.savefig(buf, format='png', dpi=150, bbox_inches='tight', pil_kwargs=_PNG_PIL_KWARGS)
+        image_data = buf.getvalue()
         
-        # Save or return
         if save_path:
-            plt.savefig(save_path, dpi=150, bbox_inches='tight')
+            with open(save_path, 'wb') as f:
+                f.write(image_data)
             self.logger.log_info(f"Market segmentation chart saved")
         
-        # Return as bytes
-        buf = BytesIO()
-        plt.savefig(buf, format='png', dpi=150, bbox_inches='tight')
-        plt.close()
-        buf.seek(0)
-        return buf.read()
+        return image_data
     
     def create_pmf_dashboard(
         self,
@@ -148,7 +158,8 @@ class InfographicGenerator:
         self.logger.log_agent_start("Infographic Generator", "Creating PMF dashboard")
         
         # Create figure with subplots
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(12, 10))
+        fig = Figure(figsize=(12, 10))
+        (ax1, ax2), (ax3, ax4) = fig.subplots(2, 2)
         fig.suptitle('Product-Market Fit Analysis Dashboard', fontsize=16, fontweight='bold')
         
         # 1. PMF Score Gauge
@@ -163,14 +174,13 @@ class InfographicGenerator:
         # 4. Top Benefits vs Concerns
         self._create_benefits_concerns_chart(ax4, market_fit)
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         # Save to bytes
         buffer = BytesIO()
-        plt.savefig(buffer, format='png', bbox_inches='tight', dpi=300)
+        fig.savefig(buffer, format='png', bbox_inches='tight', dpi=300, pil_kwargs=_PNG_PIL_KWARGS)
         buffer.seek(0)
         image_data = buffer.read()
-        plt.close(fig)
         
         # Save to file if path provided
         if save_path:
@@ -309,7 +319,8 @@ class InfographicGenerator:
         
         if not history:
             # Return empty/placeholder
-            fig, ax = plt.subplots(figsize=(10, 6))
+            fig = Figure(figsize=(10, 6))
+            ax = fig.subplots()
             ax.text(0.5, 0.5, 'No iteration history available', 
                    ha='center', va='center', fontsize=14)
             ax.set_xlim(0, 1)
@@ -322,7 +333,8 @@ class InfographicGenerator:
             nps_scores = [h['nps'] for h in history]
             
             # Create figure
-            fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(10, 8))
+            fig = Figure(figsize=(10, 8))
+            ax1, ax2 = fig.subplots(2, 1)
             fig.suptitle('Iteration Progress', fontsize=16, fontweight='bold')
             
             # PMF score progression
@@ -345,14 +357,13 @@ class InfographicGenerator:
             ax2.legend()
             ax2.grid(True, alpha=0.3)
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         # Save to bytes
         buffer = BytesIO()
-        plt.savefig(buffer, format='png', bbox_inches='tight', dpi=300)
+        fig.savefig(buffer, format='png', bbox_inches='tight', dpi=300, pil_kwargs=_PNG_PIL_KWARGS)
         buffer.seek(0)
         image_data = buffer.read()
-        plt.close(fig)
         
         if save_path:
             with open(save_path, 'wb') as f:
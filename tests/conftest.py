@@ -0,0 +1,38 @@
+"""Shared fixtures for the test suite."""
+
+import pytest
+from src.utils.models import Persona, ProductConcept
+
+
+@pytest.fixture
+def persona_factory():
+    """Build minimal personas; only identity fields vary between tests."""
+    def create_persona(name: str, age: int = 30, occupation: str = "Engineer") -> Persona:
+        return Persona(
+            name=name,
+            age=age,
+            occupation=occupation,
+            income_bracket="medium",
+            location_type="urban",
+            tech_savviness=3,
+            values=["quality"],
+            pain_points=["time"],
+            personality_traits="curious",
+            shopping_behavior="researches first",
+        )
+
+    return create_persona
+
+
+@pytest.fixture
+def concept():
+    """Product concept shared by tests that evaluate one."""
+    return ProductConcept(
+        name="Smart Bottle",
+        tagline="Stay hydrated",
+        target_market="remote workers",
+        problem_solved="forgetting to drink water",
+        features=["Tracks intake", "Reminders"],
+        differentiators=["Cheap"],
+        pricing_model="$49 one-time",
+    )
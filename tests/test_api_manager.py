@@ -0,0 +1,163 @@
+"""Tests for the OpenRouter client with a stubbed completions endpoint."""
+
+import pytest
+from types import SimpleNamespace
+from unittest.mock import Mock
+from openai.types.chat import ChatCompletion
+from src.utils import api_manager
+from src.utils.api_manager import OpenRouterClient
+from src.utils.config_loader import Config
+
+
+MESSAGES = [{"role": "user", "content": "Name a product"}]
+
+
+@pytest.fixture
+def config(monkeypatch, tmp_path):
+    """Config the client picks up, with its cache in tmp_path and no rate limit."""
+    monkeypatch.setenv("OPENROUTER_API_KEY", "sk-or-v1-test-key-for-testing")
+    config = Config()
+    config.cache_dir = tmp_path / "cache"
+    config.api_rate_limit = 0
+    monkeypatch.setattr(api_manager, "get_config", lambda: config)
+    return config
+
+
+class TestResponseCache:
+    """Tests for the on-disk response cache."""
+
+    @staticmethod
+    def create_completion(content: str) -> ChatCompletion:
+        """Helper to build a minimal chat completion."""
+        return ChatCompletion.model_validate({
+            "id": "cmpl-test",
+            "object": "chat.completion",
+            "created": 0,
+            "model": "test/model",
+            "choices": [{
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"role": "assistant", "content": content},
+            }],
+            "usage": {"prompt_tokens": 3, "completion_tokens": 2, "total_tokens": 5},
+        })
+
+    def create_client(self, monkeypatch, config, **settings) -> OpenRouterClient:
+        """Helper to build a client whose completions endpoint returns 'answer N' for call N."""
+        for name, value in settings.items():
+            setattr(config, name, value)
+        client = OpenRouterClient()
+        create = Mock(side_effect=lambda **kwargs: self.create_completion(f"answer {create.call_count}"))
+        monkeypatch.setattr(client.client.chat.completions, "create", create)
+        return client
+
+    @staticmethod
+    def ask(client: OpenRouterClient, temperature: float = 0.0) -> str:
+        """Send the same request and return the answer text."""
+        response = client.chat_completion(model="test/model", messages=MESSAGES, temperature=temperature)
+        return response.choices[0].message.content
+
+    def test_identical_request_hits_cache(self, monkeypatch, config):
+        """Test a repeated low-temperature request is served from the cache."""
+        client = self.create_client(monkeypatch, config, api_cache_responses=True, api_cache_max_temperature=0.3)
+
+        assert self.ask(client) == "answer 1"
+        assert self.ask(client) == "answer 1"
+        assert client.client.chat.completions.create.call_count == 1
+
+    def test_different_request_misses_cache(self, monkeypatch, config):
+        """Test changing any request parameter calls the API again."""
+        client = self.create_client(monkeypatch, config, api_cache_responses=True, api_cache_max_temperature=0.3)
+
+        assert self.ask(client, temperature=0.0) == "answer 1"
+        assert self.ask(client, temperature=0.2) == "answer 2"
+        assert client.client.chat.completions.create.call_count == 2
+
+    def test_hot_temperature_never_cached(self, monkeypatch, config):
+        """Test requests above cache_max_temperature always reach the API."""
+        client = self.create_client(monkeypatch, config, api_cache_responses=True, api_cache_max_temperature=0.3)
+
+        assert self.ask(client, temperature=0.8) == "answer 1"
+        assert self.ask(client, temperature=0.8) == "answer 2"
+
+    def test_disabled_in_settings(self, monkeypatch, config):
+        """Test nothing is cached when cache_responses is off."""
+        client = self.create_client(monkeypatch, config, api_cache_responses=False)
+
+        assert self.ask(client) == "answer 1"
+        assert self.ask(client) == "answer 2"
+
+    def test_bypass_for_fresh_run(self, monkeypatch, config):
+        """Test use_response_cache=False (--no-cache) skips cached answers."""
+        client = self.create_client(monkeypatch, config, api_cache_responses=True, api_cache_max_temperature=0.3)
+        assert self.ask(client) == "answer 1"
+
+        client.use_response_cache = False
+
+        assert self.ask(client) == "answer 2"
+        assert client.client.chat.completions.create.call_count == 2
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Patch the rate limiter's clock; sleeping advances it."""
+    clock = SimpleNamespace(now_ns=0, sleeps=[])
+
+    def sleep(seconds: float):
+        clock.sleeps.append(round(seconds, 6))
+        clock.now_ns += int(seconds * 1_000_000_000)
+
+    monkeypatch.setattr(api_manager.time, "monotonic_ns", lambda: clock.now_ns)
+    monkeypatch.setattr(api_manager.time, "sleep", sleep)
+    return clock
+
+
+class TestRateLimit:
+    """Tests for the sliding-window rate limiter."""
+
+    def create_client(self, config, limit) -> OpenRouterClient:
+        """Helper to build a client allowing `limit` calls per second."""
+        config.api_rate_limit = limit
+        config.api_rate_period = 1
+        return OpenRouterClient()
+
+    def test_expired_calls_trimmed(self, config, clock):
+        """Test calls older than the period drop out of the window without waiting."""
+        client = self.create_client(config, 2)
+        client._check_rate_limit()
+        clock.now_ns += 500_000_000
+        client._check_rate_limit()
+        clock.now_ns += 700_000_000
+
+        client._check_rate_limit()
+
+        assert list(client.call_times) == [500_000_000, 1_200_000_000]
+        assert clock.sleeps == []
+
+    def test_full_window_waits_for_oldest_call(self, config, clock):
+        """Test a call over the limit sleeps until the oldest call leaves the window."""
+        client = self.create_client(config, 2)
+        client._check_rate_limit()
+        clock.now_ns += 100_000_000
+        client._check_rate_limit()
+        clock.now_ns += 100_000_000
+
+        client._check_rate_limit()
+
+        assert clock.sleeps == [0.8]
+        assert list(client.call_times) == [1_000_000_000]
+
+    @pytest.mark.parametrize("limit", [0, float("inf")])
+    def test_disabled_is_noop(self, config, clock, limit):
+        """Test a limit of 0 or .inf never records calls or waits."""
+        client = self.create_client(config, limit)
+
+        for _ in range(100):
+            client._check_rate_limit()
+
+        assert not client.call_times
+        assert clock.sleeps == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
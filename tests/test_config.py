@@ -33,6 +33,20 @@ class TestConfigValidation:
         assert "invalid" in str(exc_info.value).lower()
         assert "sk-or-v1-" in str(exc_info.value)
 
+    def test_invalid_settings_rejected_every_time(self, monkeypatch, tmp_path):
+        """Test that invalid settings keep raising (validation failures aren't cached)."""
+        import shutil
+        monkeypatch.setenv("OPENROUTER_API_KEY", "sk-or-v1-test-key-for-testing")
+        shutil.copytree(Config().config_dir, tmp_path, dirs_exist_ok=True)
+        settings_path = tmp_path / "settings.yaml"
+        text = settings_path.read_text()
+        settings_path.write_text(text.replace("max_iterations:", "max_iterations: 50 #", 1))
+
+        for _ in range(2):
+            with pytest.raises(ConfigurationError) as exc_info:
+                Config(tmp_path)
+            assert "max_iterations" in str(exc_info.value)
+
 
 @pytest.fixture
 def valid_config(monkeypatch):
@@ -67,6 +81,7 @@ class TestConfigAccess:
         assert 0 <= config.pmf_threshold <= 100
         assert isinstance(config.personas_count, int)
         assert config.personas_count >= 10
+        assert config.pmf_plateau_epsilon >= 0
     
     def test_social_media_configs(self, monkeypatch):
         """Test accessing social media configurations."""
@@ -139,6 +154,41 @@ class TestConfigSettingAccess:
         if x_max is not None:
             assert isinstance(x_max, int)
 
+    def test_cache_dir_expands_user(self, monkeypatch):
+        """Test that the cache directory is returned as an expanded Path."""
+        monkeypatch.setenv("OPENROUTER_API_KEY", "sk-or-v1-test-key-for-testing")
+        config = Config()
+
+        assert isinstance(config.cache_dir, Path)
+        assert "~" not in str(config.cache_dir)
+
+    def test_yaml_edits_are_picked_up(self, monkeypatch, tmp_path):
+        """Test that cached YAML is re-parsed once the file changes."""
+        import shutil
+        monkeypatch.setenv("OPENROUTER_API_KEY", "sk-or-v1-test-key-for-testing")
+        shutil.copytree(Config().config_dir, tmp_path, dirs_exist_ok=True)
+        settings_path = tmp_path / "settings.yaml"
+
+        assert Config(tmp_path).max_iterations != 2
+
+        text = settings_path.read_text()
+        settings_path.write_text(text.replace("max_iterations:", "max_iterations: 2 #", 1))
+        stat = settings_path.stat()
+        os.utime(settings_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert Config(tmp_path).max_iterations == 2
+
+    def test_mutating_settings_does_not_leak(self, monkeypatch):
+        """Test in-place edits to one instance's settings/prompts don't reach later instances."""
+        monkeypatch.setenv("OPENROUTER_API_KEY", "sk-or-v1-test-key-for-testing")
+        config = Config()
+        config.settings["workflow"]["max_iterations"] = 99
+        config.prompts["ideator"]["system_prompt"] = "changed"
+
+        fresh = Config()
+        assert fresh.settings["workflow"]["max_iterations"] != 99
+        assert fresh.get_prompt("ideator", "system_prompt") != "changed"
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,138 @@
+"""Tests for file manager utilities."""
+
+import json
+import numpy as np
+import pytest
+from datetime import datetime
+from src.utils.file_manager import FileManager
+
+
+class TestJsonRoundTrip:
+    """Tests for JSON save/load."""
+
+    def test_save_and_load_json(self, tmp_path):
+        """Test that saved JSON loads back unchanged."""
+        fm = FileManager(str(tmp_path / "outputs"))
+        data = {"name": "Café ☕", "scores": [1.5, 2.0], "nested": {"ok": True, "none": None}}
+        path = tmp_path / "data.json"
+
+        fm.save_json(data, path)
+
+        assert fm.load_json(path) == data
+        # Still readable by the stdlib, with non-ASCII written as UTF-8
+        assert json.loads(path.read_text(encoding="utf-8")) == data
+        assert "Café" in path.read_text(encoding="utf-8")
+
+    def test_save_json_non_native_values(self, tmp_path):
+        """Test numpy values, non-str keys and unknown objects are serialized."""
+        fm = FileManager(str(tmp_path / "outputs"))
+        path = tmp_path / "data.json"
+
+        fm.save_json({
+            "pmf": np.float64(42.5),
+            "counts": np.array([1, 2, 3]),
+            1: "int key",
+            "when": datetime(2025, 1, 2, 3, 4, 5),
+            "path": tmp_path,
+        }, path)
+
+        loaded = fm.load_json(path)
+        assert loaded["pmf"] == 42.5
+        assert loaded["counts"] == [1, 2, 3]
+        assert loaded["1"] == "int key"
+        assert loaded["when"].startswith("2025-01-02T03:04:05")
+        assert loaded["path"] == str(tmp_path)
+
+    def test_save_json_bytes_matches_save_json(self, tmp_path):
+        """Test pre-serialized model JSON is written as-is and matches save_json."""
+        from src.utils.models import CriticFeedback
+
+        fm = FileManager(str(tmp_path / "outputs"))
+        feedback = CriticFeedback(
+            strengths_to_amplify=["Strong value prop"],
+            critical_gaps=["High price"],
+            specific_refinements={"pricing": ["Lower to $29"]},
+            strategic_direction="Focus on value",
+        )
+
+        fm.save_json_bytes(feedback.model_dump_json(indent=2).encode(), tmp_path / "a.json")
+        fm.save_json(feedback.model_dump(), tmp_path / "b.json")
+
+        assert (tmp_path / "a.json").read_bytes() == (tmp_path / "b.json").read_bytes()
+
+    def test_save_jsonl_one_record_per_line(self, tmp_path):
+        """Test JSON Lines output has one parseable record per line."""
+        fm = FileManager(str(tmp_path / "outputs"))
+        records = [{"iteration": i, "pmf_score": np.float64(i * 10.5)} for i in range(3)]
+        path = tmp_path / "history.jsonl"
+
+        count = fm.save_jsonl(iter(records), path)
+
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert count == 3
+        assert [json.loads(line) for line in lines] == [
+            {"iteration": i, "pmf_score": i * 10.5} for i in range(3)
+        ]
+
+    def test_save_json_array_matches_save_json(self, tmp_path):
+        """Test streamed model JSON array matches save_json of the dumped list."""
+        from src.utils.models import PersonaResponse
+
+        fm = FileManager(str(tmp_path / "outputs"))
+        responses = [
+            PersonaResponse(
+                persona_name=f"Zoë {i}",
+                interest_response='I "love" it\nreally',
+                purchase_intent_response="maybe",
+                disappointment_response="very ☹",
+                recommendation_response="yes",
+                main_benefit="saves time",
+                concerns=["price"] * i,
+            )
+            for i in range(3)
+        ]
+
+        for items in (responses, []):
+            count = fm.save_json_array(
+                (r.model_dump_json(indent=2).encode() for r in items), tmp_path / "a.json"
+            )
+            fm.save_json([r.model_dump() for r in items], tmp_path / "b.json")
+
+            assert count == len(items)
+            assert (tmp_path / "a.json").read_bytes() == (tmp_path / "b.json").read_bytes()
+
+    def test_failed_write_keeps_previous_file(self, tmp_path):
+        """Test an error mid-write leaves the old file intact and no temp file."""
+        fm = FileManager(str(tmp_path / "outputs"))
+        path = tmp_path / "history.jsonl"
+        fm.save_jsonl([{"iteration": 1}], path)
+
+        def records():
+            yield {"iteration": 2}
+            raise RuntimeError("interrupted")
+
+        with pytest.raises(RuntimeError):
+            fm.save_jsonl(records(), path)
+
+        assert json.loads(path.read_text(encoding="utf-8")) == {"iteration": 1}
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["history.jsonl", "outputs"]
+
+
+class TestOutputListing:
+    """Tests for output directory listing."""
+
+    def test_list_and_latest_ignore_files(self, tmp_path):
+        """Test only directories are listed and the newest one is returned."""
+        import os
+        fm = FileManager(str(tmp_path / "outputs"))
+        old = fm.create_output_directory("Old", datetime(2025, 1, 1))
+        new = fm.create_output_directory("New", datetime(2025, 1, 2))
+        os.utime(old, (1_000_000, 1_000_000))
+        (fm.base_output_dir / "notes.txt").write_text("not an output")
+
+        assert sorted(fm.list_outputs()) == sorted([old.name, new.name])
+        assert fm.get_latest_output() == new
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
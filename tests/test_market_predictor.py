@@ -0,0 +1,159 @@
+"""Tests for market simulation with a stubbed API client."""
+
+import re
+import numpy as np
+import pytest
+from unittest.mock import Mock
+
+pytest.importorskip("semantic_similarity_rating")
+
+from src.agents.market_predictor import MarketPredictorAgent
+from src.utils.models import PersonaResponse, PersonaResponseBatch
+
+
+@pytest.fixture
+def agent(monkeypatch):
+    """MarketPredictorAgent without SSR raters (no embedding model is loaded)."""
+    monkeypatch.setenv("OPENROUTER_API_KEY", "sk-or-v1-test-key-for-testing")
+    monkeypatch.setattr(MarketPredictorAgent, "_initialize_ssr_raters", lambda self: None)
+    return MarketPredictorAgent()
+
+
+class TestBatchedSimulation:
+    """Tests for answering several personas per API call."""
+
+    NAME_RE = re.compile(r"Persona \d+")
+
+    def create_response(self, benefit: str) -> PersonaResponse:
+        """Helper to create a response; the model-supplied name is deliberately wrong."""
+        return PersonaResponse(
+            persona_name="Someone else",
+            interest_response="Interested",
+            purchase_intent_response="Might buy",
+            disappointment_response="Somewhat",
+            recommendation_response="Maybe",
+            main_benefit=benefit,
+            concerns=[],
+        )
+
+    def stub_client(self, agent, batch_mode: str = "ok") -> Mock:
+        """Helper to answer each persona named in the prompt with main_benefit 'for <name>'."""
+        def answer(messages, response_model, **kwargs):
+            names = self.NAME_RE.findall(messages[-1]["content"])
+            if response_model is PersonaResponse:
+                return self.create_response(f"for {names[0]}")
+            if batch_mode == "short":
+                names = names[:-1]
+            elif batch_mode == "unparseable":
+                raise ValueError("Failed to parse structured output")
+            return PersonaResponseBatch(responses=[self.create_response(f"for {name}") for name in names])
+
+        agent.client = Mock()
+        agent.client.chat_completion_with_structured_output.side_effect = answer
+        return agent.client.chat_completion_with_structured_output
+
+    @staticmethod
+    def call_counts(stub: Mock) -> tuple:
+        """(batch calls, single calls) made through the stub."""
+        models = [call.kwargs["response_model"] for call in stub.call_args_list]
+        return models.count(PersonaResponseBatch), models.count(PersonaResponse)
+
+    def test_responses_mapped_to_personas_in_order(self, agent, concept, persona_factory):
+        """Test batched responses get the right persona_name and keep persona order."""
+        stub = self.stub_client(agent)
+        agent.personas_per_call = 3
+        personas = [persona_factory(f"Persona {i}", 20 + i) for i in range(7)]
+
+        responses = agent.simulate_market_response(concept, personas)
+
+        assert [r.persona_name for r in responses] == [p.name for p in personas]
+        assert all(r.main_benefit == f"for {r.persona_name}" for r in responses)
+        # Groups of 3, 3 and 1: the trailing single persona is asked directly
+        assert self.call_counts(stub) == (2, 1)
+
+    @pytest.mark.parametrize("batch_mode", ["short", "unparseable"])
+    def test_failed_batch_falls_back_to_single_calls(self, agent, concept, persona_factory, batch_mode):
+        """Test a count mismatch or parse failure retries each persona individually."""
+        stub = self.stub_client(agent, batch_mode)
+        agent.personas_per_call = 4
+        personas = [persona_factory(f"Persona {i}", 20 + i) for i in range(4)]
+
+        responses = agent.simulate_market_response(concept, personas)
+
+        assert [r.persona_name for r in responses] == [p.name for p in personas]
+        assert all(r.main_benefit == f"for {r.persona_name}" for r in responses)
+        assert self.call_counts(stub) == (1, 4)
+
+    @pytest.mark.parametrize("personas_per_call, count", [(1, 3), (5, 1)])
+    def test_group_of_one_never_batches(self, agent, concept, persona_factory, personas_per_call, count):
+        """Test single-persona groups always use the per-persona call."""
+        stub = self.stub_client(agent)
+        agent.personas_per_call = personas_per_call
+        personas = [persona_factory(f"Persona {i}", 20 + i) for i in range(count)]
+
+        responses = agent.simulate_market_response(concept, personas)
+
+        assert [r.persona_name for r in responses] == [p.name for p in personas]
+        assert self.call_counts(stub) == (0, count)
+
+
+class TestRelevanceFilter:
+    """Tests for keeping the personas closest to the concept."""
+
+    AGE_RE = re.compile(r"(\d+)-year-old")
+
+    def stub_embedder(self, agent) -> Mock:
+        """Helper to embed the concept as [1, 0] and personas at an angle of age/100, so younger is closer."""
+        def encode(texts, normalize_embeddings=True):
+            if isinstance(texts, str):
+                return np.array([1.0, 0.0])
+            angles = [int(self.AGE_RE.search(text).group(1)) / 100 for text in texts]
+            return np.array([[np.cos(a), np.sin(a)] for a in angles])
+
+        agent._embedder = Mock()
+        agent._embedder.encode.side_effect = encode
+        return agent._embedder.encode
+
+    @pytest.mark.parametrize("count, fraction, keep", [(10, 0.5, 5), (7, 0.3, 2), (3, 0.1, 1)])
+    def test_keep_count_rounded(self, agent, concept, persona_factory, count, fraction, keep):
+        """Test round(count * fraction) personas are kept, and never fewer than one."""
+        self.stub_embedder(agent)
+        personas = [persona_factory(f"Persona {i}", 20 + i) for i in range(count)]
+
+        assert len(agent.select_relevant_personas(concept, personas, fraction)) == keep
+
+    def test_closest_kept_in_original_order(self, agent, concept, persona_factory):
+        """Test the most similar personas are returned in input order, not by score."""
+        self.stub_embedder(agent)
+        personas = [persona_factory(f"Persona {age}", age) for age in (50, 20, 40, 30, 60)]
+
+        selected = agent.select_relevant_personas(concept, personas, 0.4)
+
+        assert [p.age for p in selected] == [20, 30]
+
+    @pytest.mark.parametrize("fraction", [1.0, 1.5])
+    def test_full_fraction_returns_everyone(self, agent, concept, persona_factory, fraction):
+        """Test fraction >= 1 returns every persona without embedding anything."""
+        encode = self.stub_embedder(agent)
+        personas = [persona_factory(f"Persona {i}", 20 + i) for i in range(4)]
+
+        assert agent.select_relevant_personas(concept, personas, fraction) == personas
+        assert encode.call_count == 0
+
+    def test_persona_embeddings_reused(self, agent, concept, persona_factory):
+        """Test later calls, including case variants of the same persona, only embed the concept."""
+        encode = self.stub_embedder(agent)
+        personas = [persona_factory(f"Persona {i}", 20 + i) for i in range(4)]
+        agent.select_relevant_personas(concept, personas, 0.5)
+        assert encode.call_count == 2
+
+        variants = [persona_factory(p.name.upper(), p.age, p.occupation.lower()) for p in personas]
+        selected = agent.select_relevant_personas(concept, variants, 0.5)
+
+        assert [p.age for p in selected] == [20, 21]
+        assert encode.call_count == 3
+        assert isinstance(encode.call_args.args[0], str)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -427,6 +427,19 @@ class TestCriticFeedback:
         assert "High price" in prompt
         assert "Add X" in prompt
         assert "Focus on value" in prompt
+    
+    def test_refinement_prompt_cached(self):
+        """Test the refinement prompt is built once and excluded from dumps."""
+        feedback = CriticFeedback(
+            strengths_to_amplify=["Strong value prop"],
+            critical_gaps=["High price"],
+            specific_refinements={"pricing": ["Lower to $29"]},
+            strategic_direction="Focus on value"
+        )
+        
+        assert feedback.refinement_prompt is feedback.refinement_prompt
+        assert feedback.to_refinement_prompt() == feedback.refinement_prompt
+        assert "refinement_prompt" not in feedback.model_dump()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,70 @@
+"""Tests for persona generation with a stubbed API client."""
+
+import orjson
+import pytest
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+# src.agents pulls in the SSR rater via the market predictor
+pytest.importorskip("semantic_similarity_rating")
+
+from src.agents import persona_generator
+
+
+class TestPersonaBatches:
+    """Tests for parsing and deduplicating persona batches."""
+
+    def create_generator(self, monkeypatch, contents):
+        """Helper to build a generator whose client returns the given contents in turn."""
+        monkeypatch.setenv("OPENROUTER_API_KEY", "sk-or-v1-test-key-for-testing")
+        client = Mock()
+        client.chat_completion.side_effect = [
+            SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+            for content in contents
+        ]
+        monkeypatch.setattr(persona_generator, "get_openrouter_client", lambda: client)
+        return persona_generator.PersonaGenerator(), client
+
+    @staticmethod
+    def batch_content(*personas) -> str:
+        """Helper to encode a persona batch response."""
+        return orjson.dumps({"personas": [p.model_dump() for p in personas]}).decode()
+
+    @pytest.mark.parametrize("content", [None, "not json", '{"personas": 5}'])
+    def test_bad_content_returns_empty_batch(self, monkeypatch, content):
+        """Test empty or unparseable responses skip the batch instead of raising."""
+        generator, _ = self.create_generator(monkeypatch, [content])
+
+        assert generator._do_batch_call("prompt", 5, "Persona batch generation") == []
+
+    def test_case_insensitive_repeats_dropped_and_refilled(self, monkeypatch, persona_factory):
+        """Test repeats differing only in case/whitespace are dropped and refill batches top up the count."""
+        generator, client = self.create_generator(monkeypatch, [
+            self.batch_content(
+                persona_factory("Ana Lee"),
+                persona_factory("ANA LEE "),
+                persona_factory("Ben Ode", 41, "Nurse"),
+                persona_factory("ben ode", 41, "nurse"),
+                persona_factory("Cy Park", 52),
+            ),
+            self.batch_content(persona_factory("Dee Fox", 23), persona_factory("Eli Ray", 64)),
+        ])
+        generator.use_stratified = False
+        generator.max_concurrency = 1
+
+        personas = generator.generate_personas(5)
+
+        assert [p.name for p in personas] == ["Ana Lee", "Ben Ode", "Cy Park", "Dee Fox", "Eli Ray"]
+        assert client.chat_completion.call_count == 2
+
+    def test_same_name_different_person_kept(self, monkeypatch, persona_factory):
+        """Test personas sharing a name but not age/occupation are both kept."""
+        generator, _ = self.create_generator(monkeypatch, [])
+
+        batch = [persona_factory("Ana Lee"), persona_factory("Ana Lee", 45)]
+
+        assert generator._keep_unique(batch) == batch
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
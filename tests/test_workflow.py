@@ -0,0 +1,129 @@
+"""Tests for workflow nodes, using stub agents instead of API calls."""
+
+import os
+import shutil
+import pytest
+from types import SimpleNamespace
+from unittest.mock import Mock
+from src.orchestration.workflow import ProductIdeationWorkflow
+from src.utils.config_loader import Config
+from src.utils.logger import get_logger
+
+
+@pytest.fixture
+def config_dir(monkeypatch, tmp_path):
+    """Copy of the project config with the cache pointed at tmp_path."""
+    monkeypatch.setenv("OPENROUTER_API_KEY", "sk-or-v1-test-key-for-testing")
+    config_dir = tmp_path / "config"
+    shutil.copytree(Config().config_dir, config_dir)
+    edit_settings(config_dir, "~/.cache/product-ideation", str(tmp_path / "cache"))
+    return config_dir
+
+
+def edit_settings(config_dir, old: str, new: str):
+    """Replace text in settings.yaml and bump its mtime so the cache sees it."""
+    path = config_dir / "settings.yaml"
+    text = path.read_text()
+    assert old in text
+    path.write_text(text.replace(old, new, 1))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def workflow(config_dir):
+    """Workflow built without constructing the real agents."""
+    workflow = ProductIdeationWorkflow.__new__(ProductIdeationWorkflow)
+    workflow.config = Config(config_dir)
+    workflow.logger = get_logger()
+    workflow.use_persona_cache = True
+    return workflow
+
+
+class TestPersonaCache:
+    """Tests for reusing personas across runs."""
+
+    def stub_generator(self, workflow, persona_factory) -> Mock:
+        """Helper to replace the persona generator with one that counts calls."""
+        workflow.persona_gen = Mock()
+        workflow.persona_gen.generate_personas.side_effect = lambda count: [
+            persona_factory(f"Persona {i}", 20 + i) for i in range(count)
+        ]
+        return workflow.persona_gen.generate_personas
+
+    def test_same_settings_hit_cache(self, workflow, persona_factory):
+        """Test a second run with unchanged settings reuses cached personas."""
+        generate = self.stub_generator(workflow, persona_factory)
+
+        first = workflow._generate_personas_node({"personas_count": 10})["personas"]
+        second = workflow._generate_personas_node({"personas_count": 10})["personas"]
+
+        assert generate.call_count == 1
+        assert second == first
+
+    def test_changed_distribution_misses_cache(self, workflow, persona_factory, config_dir):
+        """Test editing the persona distributions generates fresh personas."""
+        generate = self.stub_generator(workflow, persona_factory)
+        workflow._generate_personas_node({"personas_count": 10})
+
+        edit_settings(config_dir, "Urban: 32", "Urban: 50")
+        workflow.config = Config(config_dir)
+        workflow._generate_personas_node({"personas_count": 10})
+
+        assert generate.call_count == 2
+
+    def test_cache_disabled(self, workflow, persona_factory):
+        """Test use_cache=False always generates personas."""
+        generate = self.stub_generator(workflow, persona_factory)
+        workflow.use_persona_cache = False
+
+        workflow._generate_personas_node({"personas_count": 10})
+        workflow._generate_personas_node({"personas_count": 10})
+
+        assert generate.call_count == 2
+
+
+class TestPlateauExit:
+    """Tests for stopping once PMF stops improving."""
+
+    @staticmethod
+    def decide_state(scores, max_iterations=10):
+        """Decide-node state after len(scores) iterations below the threshold."""
+        return {
+            "market_fit": SimpleNamespace(pmf_score=scores[-1]),
+            "pmf_threshold": 90.0,
+            "iteration": len(scores),
+            "max_iterations": max_iterations,
+            "history": [{"iteration": i, "pmf_score": s} for i, s in enumerate(scores, 1)],
+        }
+
+    def test_stops_after_three_flat_iterations(self, workflow):
+        """Test three scores within epsilon (0.5) finalize the run."""
+        result = workflow._decide_node(self.decide_state([30.0, 30.2, 30.4]))
+
+        assert result == {"should_continue": False}
+
+    def test_keeps_going_while_improving(self, workflow):
+        """Test a spread of at least epsilon keeps refining."""
+        result = workflow._decide_node(self.decide_state([30.0, 30.2, 30.5]))
+
+        assert result == {"should_continue": True}
+
+    def test_needs_three_iterations(self, workflow):
+        """Test the plateau rule does not fire with fewer than three iterations."""
+        result = workflow._decide_node(self.decide_state([30.0, 30.0]))
+
+        assert result == {"should_continue": True}
+
+    def test_zero_epsilon_disables(self, workflow, config_dir):
+        """Test pmf_plateau_epsilon: 0 turns the rule off, even for identical scores."""
+        edit_settings(config_dir, "pmf_plateau_epsilon: 0.5", "pmf_plateau_epsilon: 0")
+        workflow.config = Config(config_dir)
+
+        result = workflow._decide_node(self.decide_state([30.0, 30.0, 30.0]))
+
+        assert result == {"should_continue": True}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])